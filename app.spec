@@ -10,8 +10,8 @@ a = Analysis(
         ('/usr/lib/x86_64-linux-gnu/qt6/plugins/xcbglintegrations/', 'qt6_plugins/xcbglintegrations')
 	],
     data=[
-        ("src/icons/*", "icons"),
-        ("src/default_album.png", "."),
+        ("src/miniplayer/_assets/icons/*", "miniplayer/_assets/icons"),
+        ("src/miniplayer/_assets/default_album.png", "miniplayer/_assets"),
         ("mini-player.desktop", "."),
     ],
     hiddenimports=["PyQt6.QtMultimedia", "PyQt6.QtSvg"],
@@ -23,6 +23,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=1,
 )
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
@@ -46,5 +47,5 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon="src/icons/mini-player.ico",
+    icon="src/miniplayer/_assets/icons/mini-player.ico",
 )
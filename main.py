@@ -8,11 +8,16 @@ Main entry point for running the MiniPlayer application.
 import os
 import sys
 
-# Add src directory to Python path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+if __name__ == "__main__":
+    # Prefer an installed package (pip install -e .) and only fall back
+    # to the src directory when running from a fresh checkout
+    try:
+        import miniplayer  # noqa: F401
+    except ImportError:
+        src_dir = os.path.join(os.path.dirname(__file__), "src")
+        sys.path.insert(0, src_dir)
 
-from miniplayer.app import main
+    # Imported here so that importing this module does not load PyQt6
+    from miniplayer.app import main
 
-if __name__ == "__main__":
     main()
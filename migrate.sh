@@ -24,7 +24,7 @@ echo "✅ Backup created at: ${backup_dir}"
 
 # Migrate settings if needed
 echo "⚙️ Migrating settings..."
-python3 migrate_settings.py
+python3 migrate_settings.py --verbose
 
 # Run the app from the new structure
 echo ""
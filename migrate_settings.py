@@ -5,11 +5,10 @@ Migration script for MiniPlayer settings.
 This script helps migrate settings from the old flat structure to the new modular structure.
 """
 
-import configparser
+import logging
 import os
-import shutil
-import sys
-from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 
 def migrate_settings():
@@ -17,26 +16,64 @@ def migrate_settings():
     old_config = "mini_player.ini"
 
     # Check if old config exists
-    if not os.path.exists(old_config):
-        print(
-            f"No existing config file found at {old_config}. No migration needed."
+    try:
+        config_stat = os.stat(old_config)
+    except FileNotFoundError:
+        logger.debug(
+            "No existing config file found at %s. No migration needed.",
+            old_config,
         )
         return
 
-    print("Found existing settings. Migrating to new format...")
+    logger.info("Found existing settings. Migrating to new format...")
 
-    # Create backup
+    # Create backup, unless an identical one is already in place
+    # (copy2 preserves mtime, so size + mtime identify a previous run)
     backup_path = f"{old_config}.bak"
-    shutil.copy2(old_config, backup_path)
-    print(f"Created backup at {backup_path}")
+    try:
+        backup_stat = os.stat(backup_path)
+        backup_current = (
+            backup_stat.st_size == config_stat.st_size
+            and backup_stat.st_mtime_ns == config_stat.st_mtime_ns
+        )
+    except FileNotFoundError:
+        backup_current = False
+
+    if backup_current:
+        logger.info("Backup at %s is already up to date", backup_path)
+    else:
+        import shutil
+
+        shutil.copy2(old_config, backup_path)
+        logger.info("Created backup at %s", backup_path)
 
     # The config format is the same, so we don't need to change anything
     # Just inform the user
-    print("Migration complete! Your existing settings have been preserved.")
-    print(
-        f"If you encounter any issues, you can restore the backup from {backup_path}"
+    logger.info(
+        "Migration complete! Your existing settings have been preserved."
+    )
+    logger.info(
+        "If you encounter any issues, you can restore the backup from %s",
+        backup_path,
     )
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Migrate MiniPlayer settings."
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="also report when no migration is needed",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format="%(message)s",
+        level=logging.DEBUG if args.verbose else logging.INFO,
+    )
     migrate_settings()
@@ -1,12 +1,24 @@
+import bisect
 import configparser
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
 
-from mutagen import File
-from PyQt6.QtCore import Qt, QTime, QTimer, QUrl
-from PyQt6.QtGui import QFontMetrics, QIcon, QPixmap
+from PyQt6.QtCore import (
+    QAbstractAnimation,
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QFontMetrics, QIcon, QImage, QPixmap
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtWidgets import (
     QApplication,
@@ -15,9 +27,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
+    QListView,
     QMessageBox,
-    QProgressBar,
     QProgressDialog,
     QPushButton,
     QSizePolicy,
@@ -26,6 +37,83 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from miniplayer.ui import SeekBar, TrackListModel
+from miniplayer.utils import (
+    get_icon_path,
+    read_album_art_data,
+    read_audio_metadata,
+    scale_album_art,
+)
+
+
+class TrackInfoSignals(QObject):
+    """Signals emitted by TrackInfoWorker."""
+
+    # (file path, metadata, scaled album art QImage or None)
+    loaded = pyqtSignal(str, dict, object)
+
+
+class TrackInfoWorker(QRunnable):
+    """Read track metadata and album art off the GUI thread."""
+
+    def __init__(self, file_path, read_metadata, read_album_art):
+        super().__init__()
+        self.file_path = file_path
+        self.read_metadata = read_metadata
+        self.read_album_art = read_album_art
+        self.signals = TrackInfoSignals()
+
+    def run(self):
+        """Parse the file and emit the result back to the GUI thread."""
+        metadata = self.read_metadata(self.file_path)
+        album_art = self.read_album_art(self.file_path)
+        self.signals.loaded.emit(str(self.file_path), metadata, album_art)
+
+
+class MetadataSignals(QObject):
+    """Signals emitted by MetadataWorker."""
+
+    # [(file path, (mtime_ns, size), metadata), ...] for one batch
+    loaded = pyqtSignal(list)
+
+
+class MetadataWorker(QRunnable):
+    """Read metadata for a batch of files off the GUI thread."""
+
+    def __init__(self, file_paths, read_metadata):
+        super().__init__()
+        self.file_paths = file_paths
+        self.read_metadata = read_metadata
+        self.signals = MetadataSignals()
+
+    def run(self):
+        """Parse every file and emit the whole batch at once."""
+        results = []
+        for file_path in self.file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            results.append(
+                (str(file_path), stamp, self.read_metadata(file_path))
+            )
+        self.signals.loaded.emit(results)
+
+
+class IconCache(dict):
+    """Map icon names to QIcons, loading each icon file on first use."""
+
+    def __init__(self, icon_files, resolve_path):
+        super().__init__()
+        self.icon_files = icon_files
+        self.resolve_path = resolve_path
+
+    def __missing__(self, name):
+        icon = QIcon(self.resolve_path(self.icon_files[name]))
+        self[name] = icon
+        return icon
+
 
 class AudioApp(QWidget):
     """Audio Adjuster GUI application."""
@@ -33,31 +121,74 @@ class AudioApp(QWidget):
     CONFIG_FILE = "mini_player.ini"
     CONFIG_SECTION = "Settings"
     SUPPORTED_EXTENSIONS = (".mp3", ".flac", ".wav", ".ogg")
+    # Bare lowercase suffixes for O(1) membership tests while scanning
+    EXTENSION_SET = frozenset(ext.lstrip(".") for ext in SUPPORTED_EXTENSIONS)
+    TRACK_INFO_CACHE_SIZE = 1024
+    # Tracks from the selection onwards whose metadata is read ahead
+    METADATA_BATCH_SIZE = 64
+    METADATA_CACHE_SIZE = 1024
+    ICON_FILES = {
+        "app": "mini-player.svg",
+        "play": "play.png",
+        "pause": "pause.png",
+        "prev": "prev.png",
+        "next": "next.png",
+        "reset": "reset.png",
+        "folder": "folder.png",
+        "repeat": "repeat.svg",
+        "mute": "mute.svg",
+        "unmute": "unmute.svg",
+        "play_all": "play-all.png",
+    }
 
     def __init__(self) -> None:
         super().__init__()
-        self.config = configparser.ConfigParser()
+        self.saved_settings = {}
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500)
+        self.save_timer.timeout.connect(self.write_settings)
         self.current_folder = None
+        self.current_folder_path = None
         self.current_track = None
+        self.current_track_path = None
+        self.track_info_cache = OrderedDict()
+        # Path -> ((mtime_ns, size), metadata) for tracks near the
+        # selection, filled in the background, least recently used first
+        self.metadata_cache = OrderedDict()
+        # Separate pool so prefetching never delays the playing track's info
+        self.metadata_pool = QThreadPool(self)
+        self.metadata_pool.setMaxThreadCount(2)
         self.user_stopped = False
         self.ignore_auto_advance = False
         self.settings()
+        self.load_icons()
         self.initUI()
         self.load_settings()
         self.file_list.setFocus()
-        self.fade_timer = QTimer(self)
-        self.fade_duration = 500  # milliseconds for fade out
-        self.fade_steps = 10  # number of steps for fade
-        self.fade_interval = self.fade_duration // self.fade_steps
+        # Fade out is interpolated by Qt directly on the output volume
+        self.fade_animation = QPropertyAnimation(
+            self.audio_output, b"volume", self
+        )
+        self.fade_animation.setDuration(500)  # milliseconds for fade out
+        self.fade_animation.setEndValue(0.0)
+        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         self.original_volume = 1.0
         self.event_handler()
-        self.setWindowIcon(QIcon(self.get_icon_path("mini-player.svg")))
+        self.setWindowIcon(self.icons["app"])
 
     def settings(self):
         """Set up the main window settings."""
         self.setWindowTitle("Mini Player")
         self.setGeometry(800, 500, 800, 400)
 
+    def load_icons(self):
+        """Set up the icon cache and load the default album art once."""
+        self.icons = IconCache(self.ICON_FILES, get_icon_path)
+        self.default_album_art = QPixmap(
+            get_icon_path("default_album.png")
+        ).scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio)
+
     def initUI(self):
         """Initialize the redesigned UI components."""
         # File list and search bar
@@ -70,8 +201,20 @@ class AudioApp(QWidget):
         file_list_container.addWidget(self.search_bar)
         file_list_container.setSpacing(6)
 
-        # File list
-        self.file_list = QListWidget()
+        # File list: a plain string model instead of one item object per row
+        self.track_model = TrackListModel(self)
+        # The search filter runs in C++ through a proxy over the model
+        self.track_proxy = QSortFilterProxyModel(self)
+        self.track_proxy.setSourceModel(self.track_model)
+        self.track_proxy.setFilterCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+        )
+        self.file_list = QListView()
+        self.file_list.setModel(self.track_proxy)
+        # Rows share one style, so Qt can lay them out without measuring each
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.file_list.setBatchSize(200)
         file_list_container.addWidget(self.file_list)
 
         # Add metadata display label
@@ -90,11 +233,7 @@ class AudioApp(QWidget):
             "background-color: #444; border-radius: 8px;"
         )
         self.album_art.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.album_art.setPixmap(
-            QPixmap(self.get_icon_path("default_album.png")).scaled(
-                80, 80, Qt.AspectRatioMode.KeepAspectRatio
-            )
-        )
+        self.album_art.setPixmap(self.default_album_art)
 
         self.track_label = QLabel("Now Playing: ")
         self.track_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -103,6 +242,10 @@ class AudioApp(QWidget):
         )
         self.track_title = ""
         self.track_scroll_index = 0
+        self.scroll_text = ""
+        self.scroll_advances = [0]
+        self.track_label_font = None
+        self.track_label_metrics_cache = None
         self.scroll_timer = QTimer(self)
         self.scroll_timer.timeout.connect(self.scroll_track_title)
         self.scroll_timer.setInterval(150)
@@ -123,35 +266,36 @@ class AudioApp(QWidget):
 
         # Playback buttons with icons
         self.btn_play_pause = QPushButton()
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
+        self.btn_play_pause.setIcon(self.icons["play"])
+        self.play_pause_icon = "play"
         self.btn_play_pause.setToolTip("Play / Pause")
 
         self.btn_prev = QPushButton()
-        self.btn_prev.setIcon(QIcon(self.get_icon_path("prev.png")))
+        self.btn_prev.setIcon(self.icons["prev"])
         self.btn_prev.setToolTip("Previous Track")
 
         self.btn_next = QPushButton()
-        self.btn_next.setIcon(QIcon(self.get_icon_path("next.png")))
+        self.btn_next.setIcon(self.icons["next"])
         self.btn_next.setToolTip("Next Track")
 
         self.btn_reset = QPushButton()
-        self.btn_reset.setIcon(QIcon(self.get_icon_path("reset.png")))
+        self.btn_reset.setIcon(self.icons["reset"])
         self.btn_reset.setToolTip("Stop")
 
         self.btn_opener = QPushButton()
-        self.btn_opener.setIcon(QIcon(self.get_icon_path("folder.png")))
+        self.btn_opener.setIcon(self.icons["folder"])
         self.btn_opener.setToolTip("Open Folder")
 
         self.btn_repeat = QCheckBox()
-        self.btn_repeat.setIcon(QIcon(self.get_icon_path("repeat.svg")))
+        self.btn_repeat.setIcon(self.icons["repeat"])
         self.btn_repeat.setToolTip("Repeat Track")
 
         self.btn_mute = QCheckBox()
-        self.btn_mute.setIcon(QIcon(self.get_icon_path("mute.svg")))
+        self.btn_mute.setIcon(self.icons["mute"])
         self.btn_mute.setToolTip("Mute Audio")
 
         self.btn_play_all = QCheckBox()
-        self.btn_play_all.setIcon(QIcon(self.get_icon_path("play-all.png")))
+        self.btn_play_all.setIcon(self.icons["play_all"])
         self.btn_play_all.setToolTip("Play All Tracks")
 
         self.btn_play_pause.setEnabled(True)
@@ -178,12 +322,13 @@ class AudioApp(QWidget):
         self.volume_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Progress + time
-        self.progress_bar = QProgressBar()
+        self.progress_bar = SeekBar()
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setMouseTracking(True)
 
         self.time_label = QLabel("00:00 / 00:00")
+        self.shown_time = None  # (second, duration) shown in time_label
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Layouts
@@ -241,9 +386,6 @@ class AudioApp(QWidget):
         self.media_player = QMediaPlayer()
         self.media_player.setAudioOutput(self.audio_output)
 
-        self.timer = QTimer(self)
-        self.timer.setInterval(10)
-
     def style(self):
         """Apply stylish modern look."""
         self.setStyleSheet(
@@ -270,25 +412,25 @@ class AudioApp(QWidget):
                 border: 1px solid #5BB9C2;
             }
 
-            QListWidget {
+            QListView {
                 background-color: #2B2B2B;
                 border: none;
                 border-radius: 8px;
                 padding: 5px;
             }
 
-            QListWidget::item {
+            QListView::item {
                 padding: 10px;
                 border-bottom: 1px solid #3A3A3A;
             }
 
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #5BB9C2;
                 color: #000;
                 border-radius: 5px;
             }
 
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #3A3A3A;
             }
 
@@ -367,68 +509,49 @@ class AudioApp(QWidget):
         self.btn_reset.clicked.connect(self.reset_audio)
         self.btn_prev.clicked.connect(self.skip_to_previous)
         self.btn_next.clicked.connect(self.skip_to_next)
-        self.timer.timeout.connect(self.update_progress)
-        self.progress_bar.mousePressEvent = self.progress_bar_clicked
-        self.file_list.itemSelectionChanged.connect(self.track_changed)
+        self.media_player.positionChanged.connect(self.update_progress)
+        self.progress_bar.clicked.connect(self.progress_bar_clicked)
+        self.file_list.selectionModel().selectionChanged.connect(
+            self.track_changed
+        )
         self.media_player.playbackStateChanged.connect(
             self.handle_playback_state
         )
         self.volume_slider.valueChanged.connect(self.update_volume)
         self.btn_mute.toggled.connect(self.toggle_mute)
-        self.fade_timer.timeout.connect(self.fade_step)
+        self.fade_animation.finished.connect(self.fade_finished)
         self.search_bar.textChanged.connect(self.filter_tracks)
-        self.file_list.itemDoubleClicked.connect(
-            self.play_double_clicked_track
-        )
+        self.file_list.doubleClicked.connect(self.play_double_clicked_track)
         self.media_player.mediaStatusChanged.connect(self.handle_media_status)
         self.btn_repeat.toggled.connect(self.on_repeat_toggled)
         self.btn_play_all.toggled.connect(self.on_play_all_toggled)
 
     def filter_tracks(self, text):
-        """Filter the file list based on search text."""
-        if not self.current_folder:
-            return
-
-        search_text = text.lower()
-
-        # Show all items if search is empty
-        if not search_text:
-            for i in range(self.file_list.count()):
-                self.file_list.item(i).setHidden(False)
-            return
-
-        # Filter items
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            item_text = item.text().lower()
-            item.setHidden(search_text not in item_text)
+        """Filter the file list based on the search text."""
+        self.track_proxy.setFilterFixedString(text)
 
     def toggle_play_pause(self):
         """Toggle play/pause state."""
         state = self.media_player.playbackState()
         if state == QMediaPlayer.PlaybackState.PlayingState:
             self.media_player.pause()
-            self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
-            self.timer.stop()
+            self.set_play_pause_icon("play")
         else:
             if not self.current_track:
                 self.play_audio()  # fallback if nothing playing yet
             else:
                 self.media_player.play()
-                self.btn_play_pause.setIcon(
-                    QIcon(self.get_icon_path("pause.png"))
-                )
+                self.set_play_pause_icon("pause")
                 self.btn_reset.setEnabled(True)
-                self.timer.start()
 
-    def play_double_clicked_track(self, item):
+    def play_double_clicked_track(self, index):
         """Play the track that was double-clicked in the file list."""
         if not self.current_folder:
             return
 
-        # Get the file path from the clicked item
-        rel_path = item.text()
-        file_path = Path(self.current_folder) / rel_path
+        # Get the file path from the clicked row
+        rel_path = index.data()
+        file_path = self.current_folder_path / rel_path
 
         if not file_path.exists():
             QMessageBox.warning(
@@ -447,32 +570,26 @@ class AudioApp(QWidget):
         self.ignore_auto_advance = True
         file_url = QUrl.fromLocalFile(str(file_path))
         self.current_track = file_url
+        self.current_track_path = file_path
         self.media_player.setSource(file_url)
         self.media_player.setPlaybackRate(self.slider.value() / 100.0)
 
         # Set track info and metadata
-        metadata = self.get_audio_metadata(file_path)
-        title = metadata.get("title", file_path.name)
-        self.set_track_title(title)
-        self.metadata_label.setText(self.format_metadata_display(metadata))
-        self.extract_album_art(file_path)
+        self.show_track_info(file_path)
 
         # Start playback and update UI
         self.media_player.play()
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("pause.png")))
+        self.set_play_pause_icon("pause")
         self.btn_reset.setEnabled(True)
-        self.timer.start()
         self.save_settings()
         self.update_skip_buttons()
 
     def skip_to_next(self):
         """Skip to the next track without triggering unintended resets."""
-        current_row = self.file_list.currentRow()
-        if current_row < self.file_list.count() - 1:
-            self.file_list.blockSignals(True)
+        current_row = self.current_row()
+        if current_row < self.track_proxy.rowCount() - 1:
             self.ignore_auto_advance = True
-            self.file_list.setCurrentRow(current_row + 1)
-            self.file_list.blockSignals(False)
+            self.set_current_row(current_row + 1)
             if (
                 self.media_player.playbackState()
                 != QMediaPlayer.PlaybackState.StoppedState
@@ -482,12 +599,10 @@ class AudioApp(QWidget):
 
     def skip_to_previous(self):
         """Skip to the previous track without triggering unintended resets."""
-        current_row = self.file_list.currentRow()
+        current_row = self.current_row()
         if current_row > 0:
-            self.file_list.blockSignals(True)
             self.ignore_auto_advance = True
-            self.file_list.setCurrentRow(current_row - 1)
-            self.file_list.blockSignals(False)
+            self.set_current_row(current_row - 1)
             if (
                 self.media_player.playbackState()
                 != QMediaPlayer.PlaybackState.StoppedState
@@ -513,11 +628,11 @@ class AudioApp(QWidget):
         """Toggle mute state."""
         if checked:
             self.audio_output.setVolume(0)
-            self.btn_mute.setIcon(QIcon(self.get_icon_path("unmute.svg")))
+            self.btn_mute.setIcon(self.icons["unmute"])
             self.btn_mute.setToolTip("Unmute Audio")
         else:
             self.audio_output.setVolume(self.volume_slider.value() / 100.0)
-            self.btn_mute.setIcon(QIcon(self.get_icon_path("mute.svg")))
+            self.btn_mute.setIcon(self.icons["mute"])
             self.btn_mute.setToolTip("Mute Audio")
         self.save_settings()
 
@@ -529,15 +644,11 @@ class AudioApp(QWidget):
             self.audio_output.setVolume(volume / 100.0)
         self.save_settings()
 
-    def progress_bar_clicked(self, event):
-        """Handle mouse click events on the progress bar."""
-        if self.media_player.duration() > 0:
-            # Calculate the position based on click location
-            pos = event.pos().x()
-            percent = pos / self.progress_bar.width()
-            duration = self.media_player.duration()
-            seek_position = int(percent * duration)
-            self.media_player.setPosition(seek_position)
+    def progress_bar_clicked(self, percent):
+        """Seek to the clicked fraction of the progress bar."""
+        duration = self.media_player.duration()
+        if duration > 0:
+            self.media_player.setPosition(int(percent * duration))
 
     def update_slider(self):
         """Update the speed label based on the slider value."""
@@ -561,20 +672,15 @@ class AudioApp(QWidget):
 
             # Play All mode
             if self.btn_play_all.isChecked():
-                current_row = self.file_list.currentRow()
-                if current_row < self.file_list.count() - 1:
-                    self.file_list.blockSignals(True)
-                    try:
-                        self.file_list.setCurrentRow(current_row + 1)
-                    finally:
-                        self.file_list.blockSignals(False)
+                current_row = self.current_row()
+                if current_row < self.track_proxy.rowCount() - 1:
+                    self.set_current_row(current_row + 1)
                     self.play_audio()
                     return
 
             # Fallback: reset player UI
-            self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
+            self.set_play_pause_icon("play")
             self.btn_reset.setDisabled(True)
-            self.timer.stop()
             self.update_skip_buttons()
 
     def open_file(self):
@@ -585,7 +691,8 @@ class AudioApp(QWidget):
         )
 
         if path:
-            self.current_folder = path
+            self.set_current_folder(path)
+            self.track_info_cache.clear()
             self.populate_file_list(path)
             self.save_settings()
         else:
@@ -596,54 +703,78 @@ class AudioApp(QWidget):
                 self, "Select File", initial_dir, filter=file_filter
             )
             if file:
-                self.current_folder = str(Path(file).parent)
-                self.file_list.clear()
-                self.file_list.addItem(os.path.basename(file))
+                self.set_current_folder(str(Path(file).parent))
+                self.track_info_cache.clear()
+                self.track_model.set_tracks([os.path.basename(file)])
                 self.save_settings()
 
+    def set_current_folder(self, folder):
+        """Remember the open folder, keeping a Path for joining tracks."""
+        self.current_folder = folder
+        self.current_folder_path = Path(folder) if folder else None
+
     def populate_file_list(self, folder_path):
         """Optimized recursive file search with progress feedback."""
-        self.file_list.clear()
+        self.track_model.set_tracks([])
         if not folder_path or not os.path.exists(folder_path):
             return
 
-        # Show progress
-        progress = QProgressDialog(
-            "Scanning folder...", "Cancel", 0, 100, self
-        )
+        # Show progress; the total is unknown until the walk ends, so the
+        # bar is a busy indicator and the label counts the tracks found
+        progress = QProgressDialog("Scanning folder...", "Cancel", 0, 0, self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.show()
 
-        file_count = 0
-        for root, _, files in os.walk(folder_path):
-            for file_name in files:
-                if file_name.lower().endswith(self.SUPPORTED_EXTENSIONS):
-                    rel_path = os.path.relpath(
-                        os.path.join(root, file_name), folder_path
-                    )
-                    self.file_list.addItem(rel_path)
-                    file_count += 1
-
-                # Update progress every 100 files
-                if file_count % 100 == 0:
-                    progress.setValue(file_count % 100)
-                    if progress.wasCanceled():
-                        break
-
-            if progress.wasCanceled():
-                break
-
-        self.file_list.setCurrentRow(0)
+        tracks = []
+        for rel_path in self.iter_audio_files(folder_path):
+            tracks.append(rel_path)
+
+            # Update progress every 100 files
+            if len(tracks) % 100 == 0:
+                progress.setLabelText(
+                    f"Scanning folder... {len(tracks)} tracks found"
+                )
+                progress.setValue(len(tracks))
+                if progress.wasCanceled():
+                    break
+
+        # A single model reset replaces all rows in one layout pass
+        self.track_model.set_tracks(tracks)
+
+        # Selecting the first row also starts the metadata read-ahead
+        self.set_current_row(0)
         self.update_skip_buttons()
         progress.close()
 
+    def iter_audio_files(self, folder_path, rel_dir=""):
+        """Recursively yield supported audio files relative to folder_path."""
+        subdirs = []
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    # DirEntry caches its stat, so these checks are cheap
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry)
+                        continue
+                    _, dot, ext = entry.name.rpartition(".")
+                    if dot and ext.lower() in self.EXTENSION_SET:
+                        yield os.path.join(rel_dir, entry.name)
+        except OSError:
+            return
+
+        # Files first, then subfolders, matching the old os.walk order
+        for entry in subdirs:
+            yield from self.iter_audio_files(
+                entry.path, os.path.join(rel_dir, entry.name)
+            )
+
     def play_audio(self):
         """Play the selected audio file with metadata support."""
-        if not self.file_list.selectedItems() or not self.current_folder:
+        rel_path = self.selected_track()
+        if rel_path is None or not self.current_folder:
             return
-
-        rel_path = self.file_list.selectedItems()[0].text()
-        file_path = Path(self.current_folder) / rel_path
+        file_path = self.current_folder_path / rel_path
 
         if not file_path.exists():
             QMessageBox.warning(
@@ -652,53 +783,58 @@ class AudioApp(QWidget):
             return
 
         # Stop current playback if it's a different track
-        current_file = (
-            Path(QUrl(self.current_track).path())
-            if self.current_track
-            else None
-        )
         if (
             self.media_player.playbackState()
             != QMediaPlayer.PlaybackState.StoppedState
-            and current_file != file_path
+            and self.current_track_path != file_path
         ):
             self.media_player.stop()
 
         # Set up new track
         file_url = QUrl.fromLocalFile(str(file_path))
         self.current_track = file_url
+        self.current_track_path = file_path
         self.media_player.setSource(file_url)
         self.media_player.setPlaybackRate(self.slider.value() / 100.0)
 
-        # Set track title
-        metadata = self.get_audio_metadata(file_path)
-        title = metadata.get("title", file_path.name)
-        self.set_track_title(title)
-
-        # Display metadata
-        self.metadata_label.setText(self.format_metadata_display(metadata))
-
-        # Extract and display album art
-        self.extract_album_art(file_path)
+        # Set track title, metadata and album art
+        self.show_track_info(file_path)
 
         # Start playback
         self.media_player.play()
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("pause.png")))
+        self.set_play_pause_icon("pause")
         self.btn_reset.setEnabled(True)
-        self.timer.start()
         self.save_settings()
         self.update_skip_buttons()
 
+    def track_label_metrics(self):
+        """Return font metrics for the track label, rebuilt on font change."""
+        # The stylesheet font is only applied once the label is polished,
+        # so the metrics are built lazily and keyed on the current font
+        font = self.track_label.font()
+        if font != self.track_label_font:
+            self.track_label_font = font
+            self.track_label_metrics_cache = QFontMetrics(font)
+        return self.track_label_metrics_cache
+
     def set_track_title(self, title: str):
         """Set the track title and start scrolling if necessary."""
         self.track_title = title
         self.track_scroll_index = 0
 
-        metrics = QFontMetrics(self.track_label.font())
+        metrics = self.track_label_metrics()
         text_width = metrics.horizontalAdvance(title)
         label_width = self.track_label.width()
 
         if text_width > label_width:
+            # Cumulative pixel offsets of each character in the scroll text,
+            # so each tick can locate the visible slice with a binary search
+            self.scroll_text = title + "   -   "
+            self.scroll_advances = [0]
+            offset = 0
+            for char in self.scroll_text:
+                offset += metrics.horizontalAdvance(char)
+                self.scroll_advances.append(offset)
             self.scroll_timer.start()
         else:
             self.scroll_timer.stop()
@@ -706,22 +842,16 @@ class AudioApp(QWidget):
 
     def scroll_track_title(self):
         """Scroll the track title if it exceeds the label width."""
-        spacer = "   -   "
-        full_text = self.track_title + spacer
-        metrics = QFontMetrics(self.track_label.font())
+        full_text = self.scroll_text
 
         # Extract the visible part based on pixel width
         visible_width = self.track_label.width()
         start = self.track_scroll_index
+        end = bisect.bisect_right(
+            self.scroll_advances, self.scroll_advances[start] + visible_width
+        )
 
-        for i in range(1, len(full_text)):
-            if (
-                metrics.horizontalAdvance(full_text[start : start + i])
-                > visible_width
-            ):
-                break
-
-        visible_text = full_text[start : start + i]
+        visible_text = full_text[start:end]
         self.track_label.setText(f"Now Playing: {visible_text}")
         self.track_scroll_index = (self.track_scroll_index + 1) % len(
             full_text
@@ -730,21 +860,23 @@ class AudioApp(QWidget):
     def track_changed(self):
         """Handle changes in the selected track."""
         # Only proceed if we have a valid selection and folder
-        if not self.file_list.selectedItems() or not self.current_folder:
+        new_selection = self.selected_track()
+        if new_selection is None or not self.current_folder:
             return
-
-        # Get the new selection
-        new_selection = self.file_list.selectedItems()[0].text()
         try:
-            file_path = Path(self.current_folder) / new_selection
+            file_path = self.current_folder_path / new_selection
         except TypeError:
             # Handle case where current_folder is None (shouldn't happen due to above check)
             return
 
+        # Read ahead the tracks skipping or Play All will reach next
+        row = self.track_model.rows.get(new_selection)
+        if row is not None:
+            self.prefetch_metadata(row)
+
         # Don't reset if selecting the currently playing track
         if (
-            self.current_track
-            and Path(QUrl(self.current_track).path()) == str(file_path)
+            self.current_track_path == file_path
             and self.media_player.playbackState()
             == QMediaPlayer.PlaybackState.PlayingState
         ):
@@ -757,21 +889,19 @@ class AudioApp(QWidget):
         # # Reset UI elements
         # self.progress_bar.setValue(0)
         # self.time_label.setText("00:00 / 00:00")
-        # self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
+        # self.btn_play_pause.setIcon(self.icons["play"])
         # self.btn_reset.setDisabled(True)
         # self.update_skip_buttons()
 
     def pause_audio(self):
         """Pause the currently playing audio."""
         self.media_player.pause()
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
-        self.timer.stop()
+        self.set_play_pause_icon("play")
 
     def resume_audio(self):
         """Resume the currently paused audio."""
         self.media_player.play()
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("pause.png")))
-        self.timer.start()
+        self.set_play_pause_icon("pause")
 
     def handle_playback_state(self, state):
         """Handle when playback state changes."""
@@ -794,16 +924,15 @@ class AudioApp(QWidget):
 
             # Auto Play All
             if self.btn_play_all.isChecked():
-                current_row = self.file_list.currentRow()
-                if current_row < self.file_list.count() - 1:
-                    self.file_list.setCurrentRow(current_row + 1)
+                current_row = self.current_row()
+                if current_row < self.track_proxy.rowCount() - 1:
+                    self.set_current_row(current_row + 1)
                     self.play_audio()
                     return
 
             # End of playlist or playback - update UI
-            self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
+            self.set_play_pause_icon("play")
             self.btn_reset.setDisabled(True)
-            self.timer.stop()
             self.update_skip_buttons()
 
     def reset_audio(self):
@@ -818,14 +947,12 @@ class AudioApp(QWidget):
         self.media_player.setPosition(0)
         self.progress_bar.setValue(0)
         self.time_label.setText("00:00 / 00:00")
+        self.shown_time = None
 
         # Update button states
-        self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
+        self.set_play_pause_icon("play")
         self.btn_reset.setDisabled(True)
 
-        # Stop progress timer
-        self.timer.stop()
-
     def fade_out(self):
         """Start the fade out process."""
         if (
@@ -834,73 +961,49 @@ class AudioApp(QWidget):
         ):
             return
 
+        # Already fading; keep the volume captured when it started
+        if self.fade_animation.state() == QAbstractAnimation.State.Running:
+            return
+
         # Store current volume
         self.original_volume = self.audio_output.volume()
 
-        # Start fade timer
-        self.fade_timer.start(self.fade_interval)
+        self.fade_animation.setStartValue(self.original_volume)
+        self.fade_animation.start()
 
-    def fade_step(self):
-        """Reduce volume by one step."""
-        current_volume = self.audio_output.volume()
-        step_size = self.original_volume / self.fade_steps
+    def fade_finished(self):
+        """Stop playback once the fade completes and restore the volume."""
+        self.media_player.stop()
+        self.audio_output.setVolume(
+            self.original_volume
+        )  # Restore original volume
 
-        if current_volume > step_size:
-            # Reduce volume
-            new_volume = max(0, current_volume - step_size)
-            self.audio_output.setVolume(new_volume)
-        else:
-            # Fade complete - stop everything
-            self.fade_timer.stop()
-            self.audio_output.setVolume(0)
-            self.media_player.stop()
-            self.audio_output.setVolume(
-                self.original_volume
-            )  # Restore original volume
-
-            # Reset UI as before
-            self.progress_bar.setValue(0)
-            self.time_label.setText("00:00 / 00:00")
-            self.btn_play_pause.setIcon(QIcon(self.get_icon_path("play.png")))
-            self.btn_reset.setDisabled(True)
+        # Reset UI as before
+        self.progress_bar.setValue(0)
+        self.time_label.setText("00:00 / 00:00")
+        self.shown_time = None
+        self.set_play_pause_icon("play")
+        self.btn_reset.setDisabled(True)
 
-    def get_icon_path(self, icon_name: str) -> Optional[str]:
-        """Check multiple possible icon locations"""
-        paths = [
-            # System install locations
-            f"/usr/share/icons/hicolor/scalable/apps/{icon_name}",
-            f"/usr/share/icons/hicolor/48x48/apps/{icon_name}",
-            # Local development
-            os.path.join(os.path.dirname(__file__), "icons", f"{icon_name}"),
-            os.path.join(os.path.dirname(__file__), f"{icon_name}"),
-            # Flatpak/Snap locations
-            f"/usr/share/{icon_name}",
-        ]
-        for path in paths:
-            if os.path.exists(path):
-                return path
-        return None
-
-    def update_progress(self):
-        """Update the progress bar and time label based on the current playback position."""
+    def update_progress(self, position):
+        """Update the progress bar and time label from a new playback position."""
         if (
             self.media_player.playbackState()
             != QMediaPlayer.PlaybackState.StoppedState
         ):
             duration = self.media_player.duration()
-            position = self.media_player.position()
 
             if duration > 0:
                 progress = int((position / duration) * 100)
                 self.progress_bar.setValue(progress)
 
-                # Update time labels
-                current_time = QTime(0, 0).addMSecs(position)
-                total_time = QTime(0, 0).addMSecs(duration)
-
-                self.time_label.setText(
-                    f"{current_time.toString('mm:ss')} / {total_time.toString('mm:ss')}"
-                )
+                # Update time labels only when the displayed second changes
+                shown_time = (position // 1000, duration)
+                if shown_time != self.shown_time:
+                    self.shown_time = shown_time
+                    current = self.format_duration(position // 1000)
+                    total = self.format_duration(duration // 1000)
+                    self.time_label.setText(f"{current} / {total}")
 
     def load_settings(self):
         """Load settings from config file."""
@@ -910,34 +1013,26 @@ class AudioApp(QWidget):
         self.last_repeat = False
         self.last_mute = False
         self.last_play_all = False
-        self.current_folder = None
+        self.set_current_folder(None)
         self.last_track = None
 
-        if Path(self.CONFIG_FILE).exists():
-            self.config.read(self.CONFIG_FILE)
-            if self.CONFIG_SECTION in self.config:
-                # Override defaults with saved values
-                self.current_folder = self.config.get(
-                    self.CONFIG_SECTION, "last_folder", fallback=None
-                )
-                self.last_track = self.config.get(
-                    self.CONFIG_SECTION, "last_track", fallback=None
-                )
-                self.last_volume = int(
-                    self.config.get(self.CONFIG_SECTION, "volume", fallback=50)
-                )
-                self.last_speed = int(
-                    self.config.get(self.CONFIG_SECTION, "speed", fallback=100)
-                )
-                self.last_repeat = self.config.getboolean(
-                    self.CONFIG_SECTION, "repeat", fallback=False
-                )
-                self.last_mute = self.config.getboolean(
-                    self.CONFIG_SECTION, "mute", fallback=False
-                )
-                self.last_play_all = self.config.getboolean(
-                    self.CONFIG_SECTION, "play_all", fallback=False
-                )
+        # Parse the file once; afterwards settings live in a plain dict.
+        # read() skips a missing file, so no exists() check is needed.
+        # Raw parsing: paths may contain "%", and nothing is interpolated
+        config = configparser.RawConfigParser()
+        config.read(self.CONFIG_FILE, encoding="utf-8")
+        if self.CONFIG_SECTION in config:
+            self.saved_settings = dict(config[self.CONFIG_SECTION])
+
+            # Override defaults with saved values
+            saved = self.saved_settings
+            self.set_current_folder(saved.get("last_folder"))
+            self.last_track = saved.get("last_track")
+            self.last_volume = int(saved.get("volume", 50))
+            self.last_speed = int(saved.get("speed", 100))
+            self.last_repeat = self.to_bool(saved.get("repeat"))
+            self.last_mute = self.to_bool(saved.get("mute"))
+            self.last_play_all = self.to_bool(saved.get("play_all"))
 
         # Apply settings to UI components
         self.volume_slider.setValue(self.last_volume)
@@ -949,7 +1044,7 @@ class AudioApp(QWidget):
         self.update_slider()
 
         # Populate file list if folder exists
-        if self.current_folder and Path(self.current_folder).exists():
+        if self.current_folder and self.current_folder_path.exists():
             self.populate_file_list(self.current_folder)
             if self.last_track:
                 try:
@@ -961,64 +1056,99 @@ class AudioApp(QWidget):
                     ):
                         last_track_path = Path(last_track_url.toLocalFile())
                         if last_track_path.exists():
-                            # Find the track by comparing the full path
-                            for i in range(self.file_list.count()):
-                                item = self.file_list.item(i)
-                                item_path = (
-                                    Path(self.current_folder) / item.text()
+                            # Rows are keyed by their folder-relative path
+                            rel_path = os.path.relpath(
+                                last_track_path, self.current_folder
+                            )
+                            row = self.track_model.rows.get(rel_path)
+                            if row is not None:
+                                index = self.track_model.index(row)
+                                self.file_list.setCurrentIndex(
+                                    self.track_proxy.mapFromSource(index)
                                 )
-                                if item_path == last_track_path:
-                                    self.file_list.setCurrentItem(item)
-                                    break
                 except Exception as e:
                     print(f"Error selecting last track: {e}")
 
+    def show_track_info(self, file_path):
+        """Display a track's title, metadata and album art.
+
+        Cached tracks are shown immediately; otherwise the file name is shown
+        while a TrackInfoWorker parses the file in the background.
+        """
+        key = str(file_path)
+        info = self.track_info_cache.get(key)
+        if info is not None:
+            self.track_info_cache.move_to_end(key)
+            self.apply_track_info(file_path, *info)
+            return
+
+        self.set_track_title(file_path.name)
+        worker = TrackInfoWorker(
+            file_path, self.get_audio_metadata, self.extract_album_art
+        )
+        worker.signals.loaded.connect(self.on_track_info_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_track_info_loaded(self, path, metadata, album_art):
+        """Cache a worker result and show it if the track is still current."""
+        pixmap = QPixmap.fromImage(album_art) if album_art else None
+        # Render the metadata HTML once so replays reuse the cached string
+        info = (metadata, self.format_metadata_display(metadata), pixmap)
+        self.track_info_cache[path] = info
+        if len(self.track_info_cache) > self.TRACK_INFO_CACHE_SIZE:
+            self.track_info_cache.popitem(last=False)
+
+        if self.current_track_path == Path(path):
+            self.apply_track_info(Path(path), *info)
+
+    def apply_track_info(self, file_path, metadata, metadata_html, album_art):
+        """Update the now-playing widgets from parsed track info."""
+        self.set_track_title(metadata.get("title", file_path.name))
+        self.metadata_label.setText(metadata_html)
+        self.album_art.setPixmap(album_art or self.default_album_art)
+
+    def prefetch_metadata(self, row):
+        """Queue a background metadata read for the tracks from row on."""
+        # Drop a read still queued for an earlier selection
+        self.metadata_pool.clear()
+        if not self.current_folder_path:
+            return
+
+        file_paths = []
+        window = self.track_model.tracks[row : row + self.METADATA_BATCH_SIZE]
+        for rel_path in window:
+            file_path = self.current_folder_path / rel_path
+            key = str(file_path)
+            if key in self.metadata_cache:
+                self.metadata_cache.move_to_end(key)
+            else:
+                file_paths.append(file_path)
+
+        if file_paths:
+            worker = MetadataWorker(file_paths, read_audio_metadata)
+            worker.signals.loaded.connect(self.on_metadata_loaded)
+            self.metadata_pool.start(worker)
+
+    def on_metadata_loaded(self, results):
+        """Store a batch of prefetched metadata."""
+        for path, stamp, metadata in results:
+            self.metadata_cache[path] = (stamp, metadata)
+            self.metadata_cache.move_to_end(path)
+        while len(self.metadata_cache) > self.METADATA_CACHE_SIZE:
+            self.metadata_cache.popitem(last=False)
+
     def get_audio_metadata(self, file_path):
-        """Extract metadata using mutagen."""
+        """Return cached metadata, re-reading it if the file has changed."""
+        key = str(file_path)
         try:
-            audio = File(file_path)
-            if audio is None:
-                return {}
-
-            metadata = {}
-            common_tags = [
-                "title",
-                "artist",
-                "album",
-                "date",
-                "tracknumber",
-                "genre",
-                "composer",
-                "copyright",
-                "isrc",
-            ]
-
-            # Get standard tags
-            for tag in common_tags:
-                if tag in audio.tags:
-                    metadata[tag] = str(audio.tags[tag][0])
-
-            # Get duration
-            metadata["duration"] = audio.info.length
-
-            # Get technical info
-            if hasattr(audio.info, "bitrate"):
-                metadata["bitrate"] = audio.info.bitrate // 1000
-            if hasattr(audio.info, "sample_rate"):
-                metadata["sample_rate"] = audio.info.sample_rate
-            if hasattr(audio.info, "channels"):
-                metadata["channels"] = audio.info.channels
-
-            # Handle specific file types
-            if file_path.suffix.lower() == ".flac":
-                if "tracknumber" not in metadata and "track" in audio.tags:
-                    metadata["tracknumber"] = str(audio.tags["track"][0])
-
-            return metadata
-
-        except Exception as e:
-            print(f"Error reading metadata: {e}")
+            stat = os.stat(key)
+        except OSError:
             return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.metadata_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        return read_audio_metadata(file_path)
 
     def format_metadata_display(self, metadata):
         """Format metadata for display in the UI."""
@@ -1068,121 +1198,98 @@ class AudioApp(QWidget):
         return f"{minutes:02d}:{seconds:02d}"
 
     def extract_album_art(self, file_path):
-        """Extract album art using mutagen."""
-        try:
-            audio = File(file_path)
-
-            # Check for embedded art
-            if hasattr(audio, "pictures") and audio.pictures:
-                picture = audio.pictures[0]
-                pixmap = QPixmap()
-                pixmap.loadFromData(picture.data)
-                if not pixmap.isNull():
-                    self.album_art.setPixmap(
-                        pixmap.scaled(
-                            80,
-                            80,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                    )
-                    return
+        """Extract album art, scaled for display.
 
-            # For MP3 files with ID3 tags
-            if file_path.suffix.lower() == ".mp3" and "APIC:" in audio.tags:
-                picture = audio.tags["APIC:"].data
-                pixmap = QPixmap()
-                pixmap.loadFromData(picture)
-                if not pixmap.isNull():
-                    self.album_art.setPixmap(
-                        pixmap.scaled(
-                            80,
-                            80,
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                            Qt.TransformationMode.SmoothTransformation,
-                        )
-                    )
-                    return
-
-            # For FLAC files with cover art
-            if file_path.suffix.lower() == ".flac":
-                for block in audio.metadata_blocks:
-                    if (
-                        hasattr(block, "type") and block.type == 6
-                    ):  # Picture block
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(block.data)
-                        if not pixmap.isNull():
-                            self.album_art.setPixmap(
-                                pixmap.scaled(
-                                    80,
-                                    80,
-                                    Qt.AspectRatioMode.KeepAspectRatio,
-                                    Qt.TransformationMode.SmoothTransformation,
-                                )
-                            )
-                            return
-
-            # Fallback to default image
-            self.album_art.setPixmap(
-                QPixmap(self.get_icon_path("default_album.png")).scaled(
-                    80, 80, Qt.AspectRatioMode.KeepAspectRatio
-                )
-            )
-
-        except Exception as e:
-            print(f"Error extracting album art: {e}")
-            self.album_art.setPixmap(
-                QPixmap(self.get_icon_path("default_album.png")).scaled(
-                    80, 80, Qt.AspectRatioMode.KeepAspectRatio
-                )
-            )
+        Returns a QImage rather than a QPixmap so it can run off the GUI
+        thread.
+        """
+        data = read_album_art_data(file_path)
+        if not data:
+            return None
+        image = QImage()
+        image.loadFromData(data)
+        if image.isNull():
+            return None
+        return scale_album_art(image)
 
     def save_settings(self):
-        """Save current settings to config file."""
-        if not self.config.has_section(self.CONFIG_SECTION):
-            self.config.add_section(self.CONFIG_SECTION)
+        """Schedule a settings write once changes settle for 500 ms."""
+        self.save_timer.start()
 
-        # Save paths as strings, not QUrl.toString() which can have issues with spaces
-        self.config.set(
-            self.CONFIG_SECTION, "last_folder", str(self.current_folder or "")
-        )
+    def write_settings(self):
+        """Save current settings to config file if any of them changed."""
+        self.save_timer.stop()
 
         # Store the local file path directly instead of QUrl.toString()
         if self.current_track and self.current_track.isLocalFile():
             track_path = self.current_track.toLocalFile()
-            self.config.set(self.CONFIG_SECTION, "last_track", track_path)
         else:
-            self.config.set(self.CONFIG_SECTION, "last_track", "")
+            track_path = ""
+
+        settings = {
+            **self.saved_settings,
+            # Save paths as strings, not QUrl.toString() which can have issues with spaces
+            "last_folder": str(self.current_folder or ""),
+            "last_track": track_path,
+            "volume": str(self.volume_slider.value()),
+            "speed": str(self.slider.value()),
+            "repeat": str(self.btn_repeat.isChecked()),
+            "mute": str(self.btn_mute.isChecked()),
+            "play_all": str(self.btn_play_all.isChecked()),
+        }
+        if settings == self.saved_settings:
+            return
 
-        self.config.set(
-            self.CONFIG_SECTION, "volume", str(self.volume_slider.value())
-        )
-        self.config.set(self.CONFIG_SECTION, "speed", str(self.slider.value()))
-        self.config.set(
-            self.CONFIG_SECTION, "repeat", str(self.btn_repeat.isChecked())
-        )
-        self.config.set(
-            self.CONFIG_SECTION, "mute", str(self.btn_mute.isChecked())
-        )
-        self.config.set(
-            self.CONFIG_SECTION, "play_all", str(self.btn_play_all.isChecked())
+        config = configparser.RawConfigParser()
+        config[self.CONFIG_SECTION] = settings
+        # Replace the file atomically so a crash cannot truncate it
+        temp_file = f"{self.CONFIG_FILE}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as configfile:
+            config.write(configfile)
+        os.replace(temp_file, self.CONFIG_FILE)
+        self.saved_settings = settings
+
+    @staticmethod
+    def to_bool(value, fallback=False):
+        """Parse a saved boolean the way ConfigParser.getboolean does."""
+        if value is None:
+            return fallback
+        return configparser.ConfigParser.BOOLEAN_STATES.get(
+            value.lower(), fallback
         )
 
-        with open(self.CONFIG_FILE, "w", encoding="utf-8") as configfile:
-            self.config.write(configfile)
+    def current_row(self):
+        """Return the current file list row, or -1 if there is none."""
+        return self.file_list.currentIndex().row()
+
+    def set_current_row(self, row):
+        """Make row the current and selected file list row."""
+        self.file_list.setCurrentIndex(self.track_proxy.index(row, 0))
+
+    def selected_track(self):
+        """Return the selected track's path relative to the folder."""
+        indexes = self.file_list.selectionModel().selectedIndexes()
+        return indexes[0].data() if indexes else None
+
+    def set_play_pause_icon(self, name):
+        """Show the play or pause icon, skipping no-op updates."""
+        # QAbstractButton.setIcon always repaints and relayouts the button
+        if name != self.play_pause_icon:
+            self.play_pause_icon = name
+            self.btn_play_pause.setIcon(self.icons[name])
 
     def update_skip_buttons(self):
         """Enable/disable skip buttons based on current selection."""
-        row = self.file_list.currentRow()
-        count = self.file_list.count()
+        row = self.current_row()
+        count = self.track_proxy.rowCount()
 
         self.btn_prev.setEnabled(row > 0)
         self.btn_next.setEnabled(row < count - 1)
 
     def closeEvent(self, event):
         """Override close event to save settings."""
-        self.save_settings()
+        self.write_settings()
+        self.metadata_pool.clear()
         event.accept()
 
     def keyPressEvent(self, event):
@@ -1191,12 +1298,12 @@ class AudioApp(QWidget):
         modifiers = event.modifiers()
 
         if key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
-            current_row = self.file_list.currentRow()
+            current_row = self.current_row()
             if key == Qt.Key.Key_Up:
-                self.file_list.setCurrentRow(max(0, current_row - 1))
+                self.set_current_row(max(0, current_row - 1))
             else:
-                self.file_list.setCurrentRow(
-                    min(self.file_list.count() - 1, current_row + 1)
+                self.set_current_row(
+                    min(self.track_proxy.rowCount() - 1, current_row + 1)
                 )
 
         elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
@@ -6,15 +6,27 @@ This module contains the application entry point and startup logic.
 
 import sys
 
+# PEP 810 (Python 3.15+): only load Qt and the UI when main() runs.
+# Ignored by older interpreters.
+__lazy_modules__ = [
+    "PyQt6.QtWidgets",
+    "miniplayer.ui",
+    "miniplayer.ui.main_window",
+]
+
 from PyQt6.QtWidgets import QApplication
 
 from miniplayer.ui import MainWindow
+from miniplayer.ui.main_window import STYLESHEET
 
 
 def main():
     """Main function to start the MiniPlayer application."""
     app = QApplication(sys.argv)
 
+    # Style the whole application once, before any widget is polished
+    app.setStyleSheet(STYLESHEET)
+
     window = MainWindow()
     window.show()
 
@@ -6,6 +6,7 @@ This package contains the core business logic for the MiniPlayer application.
 
 from .audio_player import AudioPlayer
 from .config_manager import ConfigManager
+from .metadata_cache import MetadataCache
 from .track_manager import TrackManager
 
-__all__ = ["AudioPlayer", "TrackManager", "ConfigManager"]
+__all__ = ["AudioPlayer", "TrackManager", "ConfigManager", "MetadataCache"]
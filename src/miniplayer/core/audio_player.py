@@ -7,10 +7,21 @@ This module contains the main audio playback logic, independent of UI components
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
-from mutagen import File
-from PyQt6.QtCore import QObject, Qt, QTimer, QUrl, pyqtSignal
+from PyQt6.QtCore import (
+    QAbstractAnimation,
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    Qt,
+    QUrl,
+    pyqtSignal,
+)
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 
+from miniplayer.utils import read_audio_metadata, read_track_info
+
+from .metadata_cache import MetadataCache
+
 
 class AudioPlayer(QObject):
     """Core audio player class that handles media playback functionality."""
@@ -22,8 +33,15 @@ class AudioPlayer(QObject):
     mediaStatusChanged = pyqtSignal(QMediaPlayer.MediaStatus)
     metadataChanged = pyqtSignal(dict)
 
-    def __init__(self) -> None:
-        """Initialize the audio player with default settings."""
+    def __init__(
+        self, metadata_cache_file: str = "mini_player_cache.db"
+    ) -> None:
+        """
+        Initialize the audio player with default settings.
+
+        Args:
+            metadata_cache_file: Path to the track metadata cache database
+        """
         super().__init__()
 
         # Set up audio components
@@ -33,12 +51,12 @@ class AudioPlayer(QObject):
         self.media_player = QMediaPlayer()
         self.media_player.setAudioOutput(self.audio_output)
 
-        # Set up timer for progress updates
-        self.timer = QTimer()
-        self.timer.setInterval(10)  # 10ms update interval
-        self.timer.timeout.connect(self._update_position)
-
-        # Connect signals
+        # Connect signals; the backend reports position changes itself,
+        # so no polling timer is needed for progress updates
+        self.media_player.positionChanged.connect(
+            self._handle_position_changed
+        )
+        self.media_player.durationChanged.connect(self.durationChanged)
         self.media_player.playbackStateChanged.connect(
             self._handle_playback_state_changed
         )
@@ -50,49 +68,58 @@ class AudioPlayer(QObject):
         self.current_track_url = None
         self.current_track_path = None
         self.current_metadata = {}
+        self.current_album_art: Optional[bytes] = None
+        self.metadata_cache = MetadataCache(metadata_cache_file)
 
-        # Fade out settings
-        self.fade_timer = QTimer()
+        # Fade out settings; Qt animates the volume without Python callbacks
         self.fade_duration = 500  # milliseconds for fade out
-        self.fade_steps = 10  # number of steps for fade
-        self.fade_interval = self.fade_duration // self.fade_steps
         self.original_volume = 1.0
-        self.fade_timer.timeout.connect(self._fade_step)
+        self.fade_animation = QPropertyAnimation(
+            self.audio_output, b"volume", self
+        )
+        self.fade_animation.setDuration(self.fade_duration)
+        self.fade_animation.setEndValue(0.0)
+        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.fade_animation.finished.connect(self._fade_finished)
 
     def load_track(self, file_path: Path) -> None:
         """
         Load a track from a file path.
 
+        The file is not stat'ed first; a missing or unplayable file is
+        reported through mediaStatusChanged as InvalidMedia.
+
         Args:
             file_path: Path to the audio file
         """
-        if not file_path.exists():
-            return
-
         # Set up new track
         file_url = QUrl.fromLocalFile(str(file_path))
         self.current_track_url = file_url
         self.current_track_path = file_path
         self.media_player.setSource(file_url)
 
-        # Get metadata
-        self.current_metadata = self.get_audio_metadata(file_path)
+        # Get metadata and album art, parsing the file only on a cache miss
+        cached = self.metadata_cache.get(file_path)
+        if cached is None:
+            metadata, album_art = read_track_info(file_path)
+            self.metadata_cache.put(file_path, metadata, album_art)
+        else:
+            metadata, album_art = cached
+        self.current_metadata = metadata
+        self.current_album_art = album_art
         self.metadataChanged.emit(self.current_metadata)
 
     def play(self) -> None:
         """Start or resume audio playback."""
         self.media_player.play()
-        self.timer.start()
 
     def pause(self) -> None:
         """Pause audio playback."""
         self.media_player.pause()
-        self.timer.stop()
 
     def stop(self) -> None:
         """Stop audio playback."""
         self.media_player.stop()
-        self.timer.stop()
 
     def seek(self, position: int) -> None:
         """
@@ -159,15 +186,19 @@ class AudioPlayer(QObject):
         if self.is_stopped():
             return
 
+        # Already fading; keep the volume captured when it started
+        if self.fade_animation.state() == QAbstractAnimation.State.Running:
+            return
+
         # Store current volume
         self.original_volume = self.audio_output.volume()
 
-        # Start fade timer
-        self.fade_timer.start(self.fade_interval)
+        self.fade_animation.setStartValue(self.original_volume)
+        self.fade_animation.start()
 
     def get_audio_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
-        Extract metadata using mutagen.
+        Extract metadata using tinytag, falling back to mutagen.
 
         Args:
             file_path: Path to the audio file
@@ -175,55 +206,12 @@ class AudioPlayer(QObject):
         Returns:
             Dictionary containing audio metadata
         """
-        try:
-            audio = File(file_path)
-            if audio is None:
-                return {}
-
-            metadata = {}
-            common_tags = [
-                "title",
-                "artist",
-                "album",
-                "date",
-                "tracknumber",
-                "genre",
-                "composer",
-                "copyright",
-                "isrc",
-            ]
-
-            # Get standard tags
-            for tag in common_tags:
-                if hasattr(audio, "tags") and audio.tags and tag in audio.tags:
-                    metadata[tag] = str(audio.tags[tag][0])
-
-            # Get duration
-            metadata["duration"] = audio.info.length
-
-            # Get technical info
-            if hasattr(audio.info, "bitrate"):
-                metadata["bitrate"] = audio.info.bitrate // 1000
-            if hasattr(audio.info, "sample_rate"):
-                metadata["sample_rate"] = audio.info.sample_rate
-            if hasattr(audio.info, "channels"):
-                metadata["channels"] = audio.info.channels
-
-            # Handle specific file types
-            if file_path.suffix.lower() == ".flac":
-                if "tracknumber" not in metadata and "track" in audio.tags:
-                    metadata["tracknumber"] = str(audio.tags["track"][0])
-
-            return metadata
-
-        except Exception as e:
-            print(f"Error reading metadata: {e}")
-            return {}
-
-    def _update_position(self) -> None:
-        """Update position and emit signal."""
+        return read_audio_metadata(file_path)
+
+    def _handle_position_changed(self, position: int) -> None:
+        """Forward position changes while a track is loaded and not stopped."""
         if not self.is_stopped():
-            self.positionChanged.emit(self.media_player.position())
+            self.positionChanged.emit(position)
 
     def _handle_playback_state_changed(self, state) -> None:
         """Forward playback state changes."""
@@ -233,20 +221,7 @@ class AudioPlayer(QObject):
         """Forward media status changes."""
         self.mediaStatusChanged.emit(status)
 
-    def _fade_step(self) -> None:
-        """Reduce volume by one step during fade out."""
-        current_volume = self.audio_output.volume()
-        step_size = self.original_volume / self.fade_steps
-
-        if current_volume > step_size:
-            # Reduce volume
-            new_volume = max(0, current_volume - step_size)
-            self.audio_output.setVolume(new_volume)
-        else:
-            # Fade complete - stop everything
-            self.fade_timer.stop()
-            self.audio_output.setVolume(0)
-            self.media_player.stop()
-            self.audio_output.setVolume(
-                self.original_volume
-            )  # Restore original volume
+    def _fade_finished(self) -> None:
+        """Stop playback once the fade completes and restore the volume."""
+        self.media_player.stop()
+        self.audio_output.setVolume(self.original_volume)
@@ -5,7 +5,8 @@ This module handles loading, saving, and accessing application settings.
 """
 
 import configparser
-from pathlib import Path
+import io
+import os
 from typing import Any, Dict, Optional, Union
 
 
@@ -24,7 +25,10 @@ class ConfigManager:
         """
         self.config_file = config_file
         self.config_section = section
-        self.config = configparser.ConfigParser()
+        # Raw parsing: paths may contain "%", and nothing is interpolated
+        self.config = configparser.RawConfigParser()
+        self.last_saved: Optional[str] = None
+        self.dirty = False
 
         # Default settings
         self.defaults = {
@@ -50,15 +54,14 @@ class ConfigManager:
         # Set defaults first
         settings = self.defaults.copy()
 
-        # Try to load from file
-        if Path(self.config_file).exists():
-            self.config.read(self.config_file)
+        # Try to load from file; read() skips a missing file on its own
+        self.config.read(self.config_file, encoding="utf-8")
 
-            if self.config_section in self.config:
-                # Override defaults with saved values
-                for key in self.defaults:
-                    if key in self.config[self.config_section]:
-                        settings[key] = self.config[self.config_section][key]
+        if self.config_section in self.config:
+            # Override defaults with saved values
+            for key in self.defaults:
+                if key in self.config[self.config_section]:
+                    settings[key] = self.config[self.config_section][key]
 
         # Ensure the section exists
         if not self.config.has_section(self.config_section):
@@ -71,9 +74,24 @@ class ConfigManager:
         return settings
 
     def save_settings(self) -> None:
-        """Save settings to config file."""
-        with open(self.config_file, "w", encoding="utf-8") as configfile:
-            self.config.write(configfile)
+        """Save settings to config file if they changed since the last save."""
+        if not self.dirty:
+            return
+
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        content = buffer.getvalue()
+        self.dirty = False
+        if content == self.last_saved:
+            return
+
+        # Write a temporary file and swap it in so a crash cannot leave
+        # a half-written config behind
+        temp_file = f"{self.config_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as configfile:
+            configfile.write(content)
+        os.replace(temp_file, self.config_file)
+        self.last_saved = content
 
     def get(self, key: str, fallback: Any = None) -> Any:
         """
@@ -118,10 +136,24 @@ class ConfigManager:
             key: Setting name
             value: Setting value
         """
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Set several setting values at once.
+
+        Args:
+            values: Mapping of setting names to values
+        """
         if not self.config.has_section(self.config_section):
             self.config.add_section(self.config_section)
 
-        self.config.set(self.config_section, key, str(value))
+        section = self.config[self.config_section]
+        for key, value in values.items():
+            value = str(value)
+            if section.get(key) != value:
+                section[key] = value
+                self.dirty = True
 
     def as_dict(self) -> Dict[str, str]:
         """
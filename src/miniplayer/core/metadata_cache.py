@@ -0,0 +1,125 @@
+"""
+Persistent metadata cache for MiniPlayer.
+
+This module stores parsed track metadata and album art in a SQLite file so
+unchanged tracks do not have to be re-parsed on every launch.
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class MetadataCache:
+    """Caches track metadata and album art keyed by path, mtime and size."""
+
+    def __init__(self, db_file: str = "mini_player_cache.db"):
+        """
+        Initialize the metadata cache.
+
+        Args:
+            db_file: Path to the SQLite database file
+        """
+        self.db_file = db_file
+        try:
+            self.connection = self._connect(db_file)
+        except sqlite3.Error as e:
+            print(f"Error opening metadata cache: {e}")
+            # Still cache for this session, just without persisting it
+            self.connection = self._connect(":memory:")
+
+    @staticmethod
+    def _connect(db_file: str) -> sqlite3.Connection:
+        """
+        Open the database and create the tracks table if needed.
+
+        Args:
+            db_file: Path to the SQLite database file
+
+        Returns:
+            Open database connection
+        """
+        connection = sqlite3.connect(db_file)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tracks ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+                "meta TEXT, art BLOB)"
+            )
+            connection.commit()
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def get(
+        self, file_path: Path
+    ) -> Optional[Tuple[Dict[str, Any], Optional[bytes]]]:
+        """
+        Look up a track, ignoring entries for files that have changed.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Tuple of (metadata, album art bytes), or None on a cache miss
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        try:
+            row = self.connection.execute(
+                "SELECT mtime, size, meta, art FROM tracks WHERE path = ?",
+                (str(file_path),),
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading metadata cache: {e}")
+            return None
+        if row is None or (row[0], row[1]) != (stat.st_mtime, stat.st_size):
+            return None
+
+        return json.loads(row[2]), row[3]
+
+    def put(
+        self,
+        file_path: Path,
+        metadata: Dict[str, Any],
+        album_art: Optional[bytes],
+    ) -> None:
+        """
+        Store a track's metadata and album art.
+
+        Args:
+            file_path: Path to the audio file
+            metadata: Parsed track metadata
+            album_art: Encoded album art image, or None
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(file_path),
+                    stat.st_mtime,
+                    stat.st_size,
+                    json.dumps(metadata),
+                    album_art,
+                ),
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing metadata cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
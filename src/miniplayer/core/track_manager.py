@@ -4,11 +4,267 @@ File management and track list functionality for MiniPlayer.
 This module handles file system operations, track lists, and file filtering.
 """
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+
+# Report scan progress once per this many matches rather than per file
+PROGRESS_INTERVAL = 64
+# Hand found tracks to the UI in batches of this size during a scan
+BATCH_SIZE = 512
+
+
+def find_audio_files(
+    folder: str,
+    extensions: Tuple[str, ...],
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    dir_mtimes: Optional[Dict[str, int]] = None,
+    batch: Optional[Callable[[List[str]], None]] = None,
+) -> List[str]:
+    """
+    Recursively find audio files below a folder.
+
+    Args:
+        folder: Folder to scan
+        extensions: Lowercase file extensions to match
+        progress: Optional callback called with (found, 0) at most once
+            per PROGRESS_INTERVAL matches
+        is_cancelled: Optional callback that stops the walk when it
+            returns True
+        dir_mtimes: Optional dict filled with the mtime (ns) of every
+            directory walked, keyed by its relative path
+        batch: Optional callback called with the new matches once at
+            least BATCH_SIZE have accumulated, and with the remaining ones
+            once the walk completes
+
+    Returns:
+        List of paths relative to the folder
+    """
+    result = []
+    next_progress = PROGRESS_INTERVAL
+    batched = 0
+
+    def walk(
+        rel: str,
+        abs_dir: str,
+        mtime: int,
+        tracks: List[str],
+        mtimes: Optional[Dict[str, int]],
+        subdirs: Optional[List[Tuple[str, str, int]]] = None,
+    ) -> None:
+        # Carry the relative path as a prefix string instead of
+        # joining and calling os.path.relpath for every match
+        if is_cancelled and is_cancelled():
+            return
+        if mtimes is not None:
+            mtimes[rel] = mtime
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                mtime = 0
+                if mtimes is not None:
+                    # Taken before listing, so a change made while
+                    # walking still invalidates the cached result
+                    try:
+                        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                subdir = (rel + name + os.sep, entry.path, mtime)
+                if subdirs is not None:
+                    subdirs.append(subdir)
+                else:
+                    walk(*subdir, tracks, mtimes)
+            elif name.lower().endswith(extensions):
+                tracks.append(rel + name)
+
+    def walk_subtree(
+        subdir: Tuple[str, str, int],
+    ) -> Tuple[List[str], Optional[Dict[str, int]]]:
+        tracks = []
+        mtimes = {} if dir_mtimes is not None else None
+        walk(*subdir, tracks, mtimes)
+        return tracks, mtimes
+
+    def add(tracks: List[str]) -> None:
+        nonlocal next_progress, batched
+        result.extend(tracks)
+        if progress and len(result) >= next_progress:
+            progress(len(result), 0)
+            next_progress = len(result) + PROGRESS_INTERVAL
+        if batch and len(result) - batched >= BATCH_SIZE:
+            batch(result[batched:])
+            batched = len(result)
+
+    try:
+        root_mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return result
+
+    # List the top level here and walk each subdirectory tree on its own
+    # thread; os.scandir releases the GIL, so directory reads overlap
+    root_tracks = []
+    subdirs = []
+    walk("", folder, root_mtime, root_tracks, dir_mtimes, subdirs)
+    add(root_tracks)
+
+    # map() yields in submission order, keeping the track order stable
+    with ThreadPoolExecutor() as executor:
+        for tracks, mtimes in executor.map(walk_subtree, subdirs):
+            add(tracks)
+            if mtimes:
+                dir_mtimes.update(mtimes)
+
+    if batch and len(result) > batched:
+        batch(result[batched:])
+    return result
+
+
+def load_scan_cache(
+    cache_file: str, folder: str, extensions: Tuple[str, ...]
+) -> Optional[List[str]]:
+    """
+    Load a cached scan result if no directory in it has changed since.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so stat-ing every directory is enough to validate the
+    result without listing any of them.
+
+    Args:
+        cache_file: Path to the scan cache file
+        folder: Folder the result must belong to
+        extensions: File extensions the result must have been matched on
+
+    Returns:
+        List of relative track paths, or None if there is no valid entry
+    """
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["folder"] != folder:
+            return None
+        if cached["extensions"] != list(extensions):
+            return None
+
+        for rel, mtime in cached["dirs"].items():
+            if os.stat(os.path.join(folder, rel)).st_mtime_ns != mtime:
+                return None
+        return cached["tracks"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_scan_cache(
+    cache_file: str,
+    folder: str,
+    extensions: Tuple[str, ...],
+    dir_mtimes: Dict[str, int],
+    tracks: List[str],
+) -> None:
+    """
+    Store a scan result, replacing any previously cached one.
+
+    Args:
+        cache_file: Path to the scan cache file
+        folder: Folder that was scanned
+        extensions: File extensions that were matched
+        dir_mtimes: Mtime (ns) of every directory walked
+        tracks: Relative track paths found
+    """
+    cached = {
+        "folder": folder,
+        "extensions": list(extensions),
+        "dirs": dir_mtimes,
+        "tracks": tracks,
+    }
+    tmp_file = f"{cache_file}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Error writing scan cache: {e}")
+
+
+class ScanSignals(QObject):
+    """Signals emitted by ScanWorker."""
+
+    # (scan id, found, total or 0)
+    progress = pyqtSignal(int, int, int)
+    # (scan id, relative paths of the tracks found since the last batch)
+    batch = pyqtSignal(int, list)
+    # (scan id, relative track paths)
+    finished = pyqtSignal(int, list)
+
+
+class ScanWorker(QRunnable):
+    """Scan a folder for audio files off the GUI thread."""
+
+    def __init__(
+        self,
+        scan_id: int,
+        folder: str,
+        extensions: Tuple[str, ...],
+        is_cancelled: Callable[[], bool],
+        cache_file: str,
+    ):
+        """
+        Initialize the scan worker.
+
+        Args:
+            scan_id: Identifier passed back with every signal
+            folder: Folder to scan
+            extensions: Lowercase file extensions to match
+            is_cancelled: Callback that returns True once the scan is stale
+            cache_file: Path to the scan cache file
+        """
+        super().__init__()
+        self.scan_id = scan_id
+        self.folder = folder
+        self.extensions = extensions
+        self.is_cancelled = is_cancelled
+        self.cache_file = cache_file
+        self.signals = ScanSignals()
+
+    def run(self) -> None:
+        """Walk the folder and emit the result back to the GUI thread."""
+        tracks = load_scan_cache(self.cache_file, self.folder, self.extensions)
+        if tracks is None:
+            dir_mtimes = {}
+            tracks = find_audio_files(
+                self.folder,
+                self.extensions,
+                lambda found, total: self.signals.progress.emit(
+                    self.scan_id, found, total
+                ),
+                self.is_cancelled,
+                dir_mtimes,
+                lambda tracks: self.signals.batch.emit(self.scan_id, tracks),
+            )
+            if self.is_cancelled():
+                return
+            save_scan_cache(
+                self.cache_file,
+                self.folder,
+                self.extensions,
+                dir_mtimes,
+                tracks,
+            )
+        elif self.is_cancelled():
+            return
+
+        self.signals.progress.emit(self.scan_id, len(tracks), len(tracks))
+        self.signals.finished.emit(self.scan_id, tracks)
 
 
 class TrackManager(QObject):
@@ -16,51 +272,117 @@ class TrackManager(QObject):
 
     # Define signals
     trackListUpdated = pyqtSignal(list)  # Emitted when track list changes
-    trackDiscoveryProgress = pyqtSignal(int, int)  # (current, total) progress
+    tracksAppended = pyqtSignal(list)  # New tracks found by a running scan
+    trackDiscoveryProgress = pyqtSignal(int, int)  # (found, total or 0)
 
-    def __init__(self, supported_extensions: Tuple[str, ...] = None):
+    def __init__(
+        self,
+        supported_extensions: Tuple[str, ...] = None,
+        scan_cache_file: str = "mini_player_scan.json",
+    ):
         """
         Initialize the track manager.
 
         Args:
             supported_extensions: Tuple of supported file extensions
+            scan_cache_file: Path to the file caching the last scan result
         """
         super().__init__()
-        self.supported_extensions = supported_extensions or (
-            ".mp3",
-            ".flac",
-            ".wav",
-            ".ogg",
+        # Lowercased once here; file names are lowercased before matching
+        self.supported_extensions = tuple(
+            extension.lower()
+            for extension in supported_extensions
+            or (".mp3", ".flac", ".wav", ".ogg")
         )
+        self.scan_cache_file = scan_cache_file
         self.current_folder = None
         self.track_list = []
+        self.scan_id = 0  # Bumped to cancel the running background scan
 
-    def set_folder(self, folder_path: str) -> bool:
+    def set_folder(
+        self, folder_path: str, tracks: Optional[List[str]] = None
+    ) -> bool:
         """
-        Set the current folder and scan for tracks.
+        Set the current folder and start scanning it for tracks.
+
+        The scan runs in the background; trackDiscoveryProgress reports
+        its progress, tracksAppended delivers tracks as they are found and
+        trackListUpdated delivers the complete result.
 
         Args:
             folder_path: Path to the music folder
+            tracks: Relative track paths to use instead of scanning
 
         Returns:
             True if folder was set successfully, False otherwise
         """
-        path = Path(folder_path)
-        if not path.exists() or not path.is_dir():
+        # isdir() is False for missing paths too, so one stat covers both
+        if not os.path.isdir(folder_path):
             return False
 
-        self.current_folder = str(path)
-        self.scan_folder()
+        self.current_folder = str(Path(folder_path))
+        if tracks is None:
+            self.start_scan()
+        else:
+            self.cancel_scan()
+            self.set_track_list(tracks)
         return True
 
+    def start_scan(self) -> None:
+        """Scan the current folder on the global thread pool."""
+        self.cancel_scan()
+        if not self.current_folder:
+            return
+
+        scan_id = self.scan_id
+        worker = ScanWorker(
+            scan_id,
+            self.current_folder,
+            self.supported_extensions,
+            lambda: self.scan_id != scan_id,
+            self.scan_cache_file,
+        )
+        worker.signals.progress.connect(
+            self._on_scan_progress, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.batch.connect(
+            self._on_scan_batch, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.finished.connect(
+            self._on_scan_finished, Qt.ConnectionType.QueuedConnection
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    def cancel_scan(self) -> None:
+        """Stop the running background scan, if any."""
+        self.scan_id += 1
+
+    def _on_scan_progress(self, scan_id: int, found: int, total: int) -> None:
+        """Forward progress from the current scan."""
+        if scan_id == self.scan_id:
+            self.trackDiscoveryProgress.emit(found, total)
+
+    def _on_scan_batch(self, scan_id: int, tracks: List[str]) -> None:
+        """Forward tracks found so far by the current scan."""
+        if scan_id == self.scan_id:
+            self.tracksAppended.emit(tracks)
+
+    def _on_scan_finished(self, scan_id: int, tracks: List[str]) -> None:
+        """Store the result of the current scan."""
+        if scan_id != self.scan_id:
+            return
+
+        self.set_track_list(tracks)
+
     def scan_folder(
         self, callback: Optional[Callable[[int, int], None]] = None
     ) -> List[str]:
         """
-        Scan the current folder for supported audio files.
+        Scan the current folder for supported audio files synchronously.
 
         Args:
-            callback: Optional progress callback function
+            callback: Optional progress callback function, called with
+                (found, 0) while scanning and (found, found) when done
 
         Returns:
             List of relative paths to audio files
@@ -68,53 +390,32 @@ class TrackManager(QObject):
         if not self.current_folder:
             return []
 
-        result = []
-        folder_path = Path(self.current_folder)
-
-        # First count files for progress reporting
-        total_files = 0
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith(self.supported_extensions):
-                    total_files += 1
-
-        # Then scan for matching files
-        found_files = 0
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith(self.supported_extensions):
-                    rel_path = os.path.relpath(
-                        os.path.join(root, file), folder_path
-                    )
-                    result.append(rel_path)
-                    found_files += 1
-
-                    # Update progress
-                    if callback:
-                        callback(found_files, total_files)
-                    self.trackDiscoveryProgress.emit(found_files, total_files)
-
-        self.track_list = result
-        self.trackListUpdated.emit(self.track_list)
+        def report(found: int, total: int) -> None:
+            if callback:
+                callback(found, total)
+            self.trackDiscoveryProgress.emit(found, total)
+
+        # The total is unknown until the walk finishes, so progress is
+        # reported with a total of 0 while scanning
+        result = find_audio_files(
+            self.current_folder, self.supported_extensions, report
+        )
+
+        # Report completion with the final count
+        report(len(result), len(result))
+
+        self.set_track_list(result)
         return result
 
-    def filter_tracks(self, search_text: str) -> List[Tuple[str, bool]]:
+    def set_track_list(self, tracks: List[str]) -> None:
         """
-        Filter tracks based on search text.
+        Replace the track list and notify listeners.
 
         Args:
-            search_text: Text to search for in track names
-
-        Returns:
-            List of tuples containing (track_path, visible)
+            tracks: Relative paths of the tracks in the current folder
         """
-        if not search_text:
-            return [(track, True) for track in self.track_list]
-
-        search_lower = search_text.lower()
-        return [
-            (track, search_lower in track.lower()) for track in self.track_list
-        ]
+        self.track_list = tracks
+        self.trackListUpdated.emit(self.track_list)
 
     def get_absolute_path(self, relative_path: str) -> Path:
         """
@@ -5,6 +5,14 @@ This package contains all UI-related components and classes.
 """
 
 from .main_window import MainWindow
-from .playlist_widget import PlaylistWidget
+from .playlist_widget import PlaylistWidget, TrackListModel
+from .scrolling_label import ScrollingLabel
+from .seek_bar import SeekBar
 
-__all__ = ["MainWindow", "PlaylistWidget"]
+__all__ = [
+    "MainWindow",
+    "PlaylistWidget",
+    "ScrollingLabel",
+    "SeekBar",
+    "TrackListModel",
+]
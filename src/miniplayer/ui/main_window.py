@@ -8,16 +8,25 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QFontMetrics, QIcon, QPixmap
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
     QLineEdit,
     QMessageBox,
-    QProgressBar,
     QProgressDialog,
     QPushButton,
     QSizePolicy,
@@ -28,35 +37,232 @@ from PyQt6.QtWidgets import (
 
 from miniplayer.core import AudioPlayer, ConfigManager, TrackManager
 from miniplayer.utils import (
-    extract_album_art,
     format_metadata_display,
     format_position_duration,
     get_icon_path,
+    scale_album_art,
 )
 
 from .playlist_widget import PlaylistWidget
+from .scrolling_label import ScrollingLabel
+from .seek_bar import SeekBar
+
+# Dark theme; main() sets it on the QApplication, and apply_styling
+# falls back to the window when the application does not carry it
+STYLESHEET = """
+QWidget {
+    background-color: #1E1E1E;
+    color: #EAEAEA;
+    font-family: 'Segoe UI', sans-serif;
+}
+
+QLabel {
+    color: #EAEAEA;
+    font-size: 14px;
+}
+
+QLabel#timeLabel {
+    color: #999;
+    font-size: 12px;
+}
+
+QLabel#album_art{
+    background-color: #444;
+    border-radius: 8px;
+    border: 1px solid #5BB9C2;
+}
+
+QListView {
+    background-color: #2B2B2B;
+    border: none;
+    border-radius: 8px;
+    padding: 5px;
+}
+
+QListView::item {
+    padding: 10px;
+    border-bottom: 1px solid #3A3A3A;
+}
+
+QListView::item:selected {
+    background-color: #5BB9C2;
+    color: #000;
+    border-radius: 5px;
+}
+
+QListView::item:hover {
+    background-color: #3A3A3A;
+}
+
+QPushButton {
+    background-color: #2B2B2B;
+    border: 1px solid #444;
+    border-radius: 6px;
+    padding: 10px;
+}
+
+QPushButton:hover {
+    background-color: #5BB9C2;
+    border: 1px solid #5BB9C2;
+}
+
+QPushButton:disabled {
+    background-color: #1E1E1E;
+    color: #777;
+}
+
+QCheckBox {
+    padding: 8px;
+}
+
+QSlider::groove:horizontal {
+    height: 6px;
+    background: #444;
+    border-radius: 3px;
+}
+
+QSlider::handle:horizontal {
+    background: #5BB9C2;
+    width: 14px;
+    height: 14px;
+    margin: -5px 0;
+    border-radius: 7px;
+}
+
+QSlider::sub-page:horizontal {
+    background: #5BB9C2;
+    border-radius: 3px;
+}
+
+QProgressBar {
+    height: 8px;
+    background-color: #333;
+    border-radius: 4px;
+}
+
+QProgressBar::chunk {
+    background-color: #5BB9C2;
+    border-radius: 4px;
+}
+
+QLineEdit {
+    padding: 6px 10px;
+    font-size: 14px;
+    border: 1px solid #555;
+    border-radius: 6px;
+    background-color: #2B2B2B;
+    color: #EAEAEA;
+}
+"""
+
+
+class AlbumArtSignals(QObject):
+    """Signals emitted by AlbumArtWorker."""
+
+    # (request id, scaled album art, a null image if it could not be read)
+    loaded = pyqtSignal(int, QImage)
+
+
+class AlbumArtWorker(QRunnable):
+    """Decode and scale album art off the GUI thread."""
+
+    def __init__(self, request_id: int, data: bytes):
+        """
+        Initialize the album art worker.
+
+        Args:
+            request_id: Identifier passed back with the result
+            data: Encoded album art image
+        """
+        super().__init__()
+        self.request_id = request_id
+        self.data = data
+        self.signals = AlbumArtSignals()
+
+    def run(self) -> None:
+        """Decode the image and emit it scaled to the display size."""
+        image = QImage()
+        if image.loadFromData(self.data):
+            image = scale_album_art(image)
+        self.signals.loaded.emit(self.request_id, image)
 
 
 class MainWindow(QWidget):
     """Main application window for MiniPlayer."""
 
+    ICON_FILES = (
+        "mini-player.svg",
+        "play.png",
+        "pause.png",
+        "prev.png",
+        "next.png",
+        "reset.png",
+        "folder.png",
+        "repeat.svg",
+        "mute.svg",
+        "unmute.svg",
+        "play-all.png",
+    )
+
     def __init__(self) -> None:
         """Initialize the main window."""
         super().__init__()
 
         # Initialize core components
-        self.audio_player = AudioPlayer()
-        self.track_manager = TrackManager()
         self.config_manager = ConfigManager()
+        # The metadata and scan caches live next to the config file
+        config_dir = os.path.dirname(
+            os.path.abspath(self.config_manager.config_file)
+        )
+        self.audio_player = AudioPlayer(
+            os.path.join(config_dir, "mini_player_cache.db")
+        )
+        self.track_manager = TrackManager(
+            scan_cache_file=os.path.join(config_dir, "mini_player_scan.json")
+        )
 
         # UI state
         self.user_stopped = False
         self.ignore_auto_advance = False
+        self.shown_time = None  # (second, duration) shown in time_label
+        self.duration = 0  # Duration of the current track in milliseconds
+        self.album_art_request = 0  # Bumped so stale art loads are ignored
+        self.album_art_key = ""  # QPixmapCache key of the requested art
+        self.scan_progress = None  # Progress dialog of the running scan
+        self.pending_track = None  # Track to select once the scan finishes
+        self.window_hidden = True  # Hidden or minimized; cleared on show
+        self.scroll_needed = False  # Title is too wide and must scroll
+        self.skip_state = None  # (prev enabled, next enabled) last applied
+
+        # Coalesce bursts of setting changes (e.g. slider drags) into one write
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(1000)
+        self.save_timer.timeout.connect(self.write_settings)
+
+        # Refresh the skip buttons once per event loop pass, however many
+        # selection and playback changes asked for it
+        self.skip_buttons_timer = QTimer(self)
+        self.skip_buttons_timer.setSingleShot(True)
+        self.skip_buttons_timer.setInterval(0)
+        self.skip_buttons_timer.timeout.connect(self.refresh_skip_buttons)
+
+        # Refilter once typing pauses instead of on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(
+            lambda: self.filter_tracks(self.search_bar.text())
+        )
 
         # Set up window properties
         self.setWindowTitle("Mini Player")
         self.setGeometry(800, 500, 800, 400)
-        self.setWindowIcon(QIcon(get_icon_path("mini-player.svg")))
+        self.load_icons()
+
+        # Scaled album art is kept in Qt's shared pixmap cache (in KB)
+        QPixmapCache.setCacheLimit(20 * 1024)
+        self.setWindowIcon(self.icons["mini-player.svg"])
 
         # Setup UI components
         self.setup_ui()
@@ -75,10 +281,21 @@ class MainWindow(QWidget):
 
         # Set up title scrolling
         self.track_title = ""
-        self.track_scroll_index = 0
         self.scroll_timer = QTimer(self)
         self.scroll_timer.timeout.connect(self.scroll_track_title)
         self.scroll_timer.setInterval(150)
+        # A marquee does not need millisecond accuracy, and a coarse timer
+        # lets the OS batch its wakeups with other timers
+        self.scroll_timer.setTimerType(Qt.TimerType.CoarseTimer)
+
+    def load_icons(self) -> None:
+        """Load every button icon and the default album art once."""
+        self.icons = {
+            name: QIcon(get_icon_path(name)) for name in self.ICON_FILES
+        }
+        self.default_album_art = scale_album_art(
+            QPixmap(get_icon_path("default_album.png"))
+        )
 
     def setup_ui(self) -> None:
         """Set up UI components."""
@@ -131,15 +348,11 @@ class MainWindow(QWidget):
             "background-color: #444; border-radius: 8px;"
         )
         self.album_art.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.album_art.setPixmap(
-            QPixmap(get_icon_path("default_album.png")).scaled(
-                80, 80, Qt.AspectRatioMode.KeepAspectRatio
-            )
-        )
+        self.album_art.setPixmap(self.default_album_art)
 
         # Track info
         track_info = QVBoxLayout()
-        self.track_label = QLabel("Now Playing: ")
+        self.track_label = ScrollingLabel("Now Playing: ")
         self.track_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.track_label.setStyleSheet(
             "font-size: 18px; font-weight: bold; color: #5BB9C2;"
@@ -165,7 +378,7 @@ class MainWindow(QWidget):
         self.metadata_label.setTextFormat(Qt.TextFormat.RichText)
 
         # Progress section
-        self.progress_bar = QProgressBar()
+        self.progress_bar = SeekBar()
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setMouseTracking(True)
@@ -179,15 +392,15 @@ class MainWindow(QWidget):
         status_controls = QHBoxLayout()
 
         self.btn_repeat = QCheckBox()
-        self.btn_repeat.setIcon(QIcon(get_icon_path("repeat.svg")))
+        self.btn_repeat.setIcon(self.icons["repeat.svg"])
         self.btn_repeat.setToolTip("Repeat Track")
 
         self.btn_mute = QCheckBox()
-        self.btn_mute.setIcon(QIcon(get_icon_path("mute.svg")))
+        self.btn_mute.setIcon(self.icons["mute.svg"])
         self.btn_mute.setToolTip("Mute Audio")
 
         self.btn_play_all = QCheckBox()
-        self.btn_play_all.setIcon(QIcon(get_icon_path("play-all.png")))
+        self.btn_play_all.setIcon(self.icons["play-all.png"])
         self.btn_play_all.setToolTip("Play All Tracks")
 
         status_controls.addWidget(self.btn_repeat)
@@ -200,25 +413,25 @@ class MainWindow(QWidget):
         playback_controls = QHBoxLayout()
 
         self.btn_opener = QPushButton()
-        self.btn_opener.setIcon(QIcon(get_icon_path("folder.png")))
+        self.btn_opener.setIcon(self.icons["folder.png"])
         self.btn_opener.setToolTip("Open Folder")
 
         self.btn_prev = QPushButton()
-        self.btn_prev.setIcon(QIcon(get_icon_path("prev.png")))
+        self.btn_prev.setIcon(self.icons["prev.png"])
         self.btn_prev.setToolTip("Previous Track")
         self.btn_prev.setDisabled(True)
 
         self.btn_play_pause = QPushButton()
-        self.btn_play_pause.setIcon(QIcon(get_icon_path("play.png")))
+        self.btn_play_pause.setIcon(self.icons["play.png"])
         self.btn_play_pause.setToolTip("Play / Pause")
 
         self.btn_next = QPushButton()
-        self.btn_next.setIcon(QIcon(get_icon_path("next.png")))
+        self.btn_next.setIcon(self.icons["next.png"])
         self.btn_next.setToolTip("Next Track")
         self.btn_next.setDisabled(True)
 
         self.btn_reset = QPushButton()
-        self.btn_reset.setIcon(QIcon(get_icon_path("reset.png")))
+        self.btn_reset.setIcon(self.icons["reset.png"])
         self.btn_reset.setToolTip("Stop")
         self.btn_reset.setDisabled(True)
 
@@ -281,11 +494,18 @@ class MainWindow(QWidget):
     def connect_signals(self) -> None:
         """Connect UI signals and slots."""
         # Search and playlist
-        self.search_bar.textChanged.connect(self.filter_tracks)
+        self.search_bar.textChanged.connect(
+            lambda _: self.filter_timer.start()
+        )
         self.playlist.itemSelectionChanged.connect(
             self.handle_track_selection_changed
         )
-        self.playlist.itemDoubleClicked.connect(self.play_selected_track)
+        self.playlist.doubleClicked.connect(self.play_selected_track)
+        self.track_manager.trackListUpdated.connect(self.populate_playlist)
+        self.track_manager.tracksAppended.connect(self.append_tracks)
+        self.track_manager.trackDiscoveryProgress.connect(
+            self.update_scan_progress
+        )
 
         # Player controls
         self.btn_play_pause.clicked.connect(self.toggle_play_pause)
@@ -304,12 +524,13 @@ class MainWindow(QWidget):
         self.btn_play_all.toggled.connect(self.on_play_all_toggled)
 
         # Progress bar
-        self.progress_bar.mousePressEvent = self.progress_bar_clicked
+        self.progress_bar.clicked.connect(self.progress_bar_clicked)
 
         # Audio player signals
         self.audio_player.positionChanged.connect(
             self.update_playback_position
         )
+        self.audio_player.durationChanged.connect(self.update_duration)
         self.audio_player.playbackStateChanged.connect(
             self.handle_playback_state_changed
         )
@@ -318,115 +539,28 @@ class MainWindow(QWidget):
         )
         self.audio_player.metadataChanged.connect(self.update_track_metadata)
 
+        # Keyboard shortcuts, looked up by keyPressEvent
+        self.key_actions = {
+            Qt.Key.Key_Up: self.select_previous_row,
+            Qt.Key.Key_Down: self.select_next_row,
+            Qt.Key.Key_Return: self.play_selected_track,
+            Qt.Key.Key_Enter: self.play_selected_track,
+            Qt.Key.Key_Space: self.toggle_play_pause,
+            Qt.Key.Key_Escape: self.reset_playback,
+        }
+        self.ctrl_key_actions = {
+            Qt.Key.Key_O: self.open_file_dialog,
+            Qt.Key.Key_M: self.btn_mute.toggle,
+            Qt.Key.Key_R: self.btn_repeat.toggle,
+            Qt.Key.Key_Plus: self.speed_up,
+            Qt.Key.Key_Minus: self.speed_down,
+        }
+
     def apply_styling(self) -> None:
-        """Apply styling to UI components."""
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: #1E1E1E;
-                color: #EAEAEA;
-                font-family: 'Segoe UI', sans-serif;
-            }
-
-            QLabel {
-                color: #EAEAEA;
-                font-size: 14px;
-            }
-
-            QLabel#timeLabel {
-                color: #999;
-                font-size: 12px;
-            }
-
-            QLabel#album_art{
-                background-color: #444;
-                border-radius: 8px;
-                border: 1px solid #5BB9C2;
-            }
-
-            QListWidget {
-                background-color: #2B2B2B;
-                border: none;
-                border-radius: 8px;
-                padding: 5px;
-            }
-
-            QListWidget::item {
-                padding: 10px;
-                border-bottom: 1px solid #3A3A3A;
-            }
-
-            QListWidget::item:selected {
-                background-color: #5BB9C2;
-                color: #000;
-                border-radius: 5px;
-            }
-
-            QListWidget::item:hover {
-                background-color: #3A3A3A;
-            }
-
-            QPushButton {
-                background-color: #2B2B2B;
-                border: 1px solid #444;
-                border-radius: 6px;
-                padding: 10px;
-            }
-
-            QPushButton:hover {
-                background-color: #5BB9C2;
-                border: 1px solid #5BB9C2;
-            }
-
-            QPushButton:disabled {
-                background-color: #1E1E1E;
-                color: #777;
-            }
-
-            QCheckBox {
-                padding: 8px;
-            }
-
-            QSlider::groove:horizontal {
-                height: 6px;
-                background: #444;
-                border-radius: 3px;
-            }
-
-            QSlider::handle:horizontal {
-                background: #5BB9C2;
-                width: 14px;
-                height: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }
-
-            QSlider::sub-page:horizontal {
-                background: #5BB9C2;
-                border-radius: 3px;
-            }
-
-            QProgressBar {
-                height: 8px;
-                background-color: #333;
-                border-radius: 4px;
-            }
-
-            QProgressBar::chunk {
-                background-color: #5BB9C2;
-                border-radius: 4px;
-            }
-
-            QLineEdit {
-                padding: 6px 10px;
-                font-size: 14px;
-                border: 1px solid #555;
-                border-radius: 6px;
-                background-color: #2B2B2B;
-                color: #EAEAEA;
-            }
-        """
-        )
+        """Apply styling unless the application already carries it."""
+        app = QApplication.instance()
+        if app is None or app.styleSheet() != STYLESHEET:
+            self.setStyleSheet(STYLESHEET)
 
     def load_settings(self) -> None:
         """Load settings from config file and apply them."""
@@ -448,25 +582,21 @@ class MainWindow(QWidget):
 
         # Set folder and select last track
         if last_folder and Path(last_folder).exists():
-            self.track_manager.set_folder(last_folder)
-            self.populate_playlist()
-
-            # Try to find and select the last played track
-            if last_track:
-                try:
-                    last_track_url = QUrl(last_track)
-                    if (
-                        last_track_url.isValid()
-                        and last_track_url.isLocalFile()
-                    ):
-                        track_path = Path(last_track_url.toLocalFile())
-                        rel_path = track_path.relative_to(Path(last_folder))
-                        for i in range(self.playlist.count()):
-                            if self.playlist.item(i).text() == str(rel_path):
-                                self.playlist.setCurrentRow(i)
-                                break
-                except Exception as e:
-                    print(f"Error selecting last track: {e}")
+            # Remember the last played track so the scan can select it
+            last_track_url = QUrl(last_track)
+            if (
+                last_track
+                and last_track_url.isValid()
+                and last_track_url.isLocalFile()
+            ):
+                track_path = Path(last_track_url.toLocalFile())
+                folder_path = Path(last_folder)
+                # A track outside the folder cannot be in its playlist
+                if folder_path in track_path.parents:
+                    rel_path = track_path.relative_to(folder_path)
+                    self.pending_track = str(rel_path)
+
+            self.open_folder(last_folder)
 
         # Update controls based on settings
         self.update_volume()
@@ -474,25 +604,35 @@ class MainWindow(QWidget):
         self.update_skip_buttons()
 
     def save_settings(self) -> None:
+        """Schedule a settings write once changes stop arriving."""
+        self.save_timer.start()
+
+    def write_settings(self) -> None:
         """Save current settings to config file."""
+        self.save_timer.stop()
+
         # Save settings
-        self.config_manager.set("volume", self.volume_slider.value())
-        self.config_manager.set("speed", self.speed_slider.value())
-        self.config_manager.set("repeat", self.btn_repeat.isChecked())
-        self.config_manager.set("mute", self.btn_mute.isChecked())
-        self.config_manager.set("play_all", self.btn_play_all.isChecked())
+        settings = {
+            "volume": self.volume_slider.value(),
+            "speed": self.speed_slider.value(),
+            "repeat": self.btn_repeat.isChecked(),
+            "mute": self.btn_mute.isChecked(),
+            "play_all": self.btn_play_all.isChecked(),
+        }
 
         # Save folder
         folder = self.track_manager.get_current_folder()
         if folder:
-            self.config_manager.set("last_folder", folder)
+            settings["last_folder"] = folder
 
         # Save track
         if self.audio_player.current_track_url:
-            self.config_manager.set(
-                "last_track", self.audio_player.current_track_url.toString()
+            settings["last_track"] = (
+                self.audio_player.current_track_url.toString()
             )
 
+        self.config_manager.update(settings)
+
         # Write to file
         self.config_manager.save_settings()
 
@@ -503,39 +643,28 @@ class MainWindow(QWidget):
         Args:
             text: Search text
         """
-        filtered_tracks = self.track_manager.filter_tracks(text)
-
-        for i in range(self.playlist.count()):
-            item = self.playlist.item(i)
-            item_text = item.text()
-            item_visible = any(
-                track[0] == item_text and track[1] for track in filtered_tracks
-            )
-            item.setHidden(not item_visible)
+        self.playlist.set_filter(text)
 
     def toggle_play_pause(self) -> None:
         """Toggle between play and pause states."""
         if self.audio_player.is_playing():
             self.audio_player.pause()
-            self.btn_play_pause.setIcon(QIcon(get_icon_path("play.png")))
+            self.btn_play_pause.setIcon(self.icons["play.png"])
         else:
             # If no track is selected, play the selected one
             if not self.audio_player.current_track_url:
                 self.play_selected_track()
             else:
                 self.audio_player.play()
-                self.btn_play_pause.setIcon(QIcon(get_icon_path("pause.png")))
+                self.btn_play_pause.setIcon(self.icons["pause.png"])
                 self.btn_reset.setEnabled(True)
 
     def play_selected_track(self) -> None:
         """Play the currently selected track in the playlist."""
-        if (
-            not self.playlist.currentItem()
-            or not self.track_manager.get_current_folder()
-        ):
+        rel_path = self.playlist.current_track()
+        if not rel_path or not self.track_manager.get_current_folder():
             return
 
-        rel_path = self.playlist.currentItem().text()
         file_path = self.track_manager.get_absolute_path(rel_path)
 
         if not file_path.exists():
@@ -554,7 +683,7 @@ class MainWindow(QWidget):
         self.audio_player.set_playback_rate(self.speed_slider.value() / 100.0)
         self.audio_player.play()
 
-        self.btn_play_pause.setIcon(QIcon(get_icon_path("pause.png")))
+        self.btn_play_pause.setIcon(self.icons["pause.png"])
         self.btn_reset.setEnabled(True)
 
         # Update UI
@@ -575,38 +704,45 @@ class MainWindow(QWidget):
         self.audio_player.seek(0)
         self.progress_bar.setValue(0)
         self.time_label.setText("00:00 / 00:00")
+        self.shown_time = None
 
         # Update button states
-        self.btn_play_pause.setIcon(QIcon(get_icon_path("play.png")))
+        self.btn_play_pause.setIcon(self.icons["play.png"])
         self.btn_reset.setDisabled(True)
 
     def skip_to_next(self) -> None:
         """Skip to the next track in the playlist."""
-        current_row = self.playlist.currentRow()
-        if current_row < self.playlist.count() - 1:
-            self.playlist.blockSignals(True)
-            self.ignore_auto_advance = True
-            self.playlist.setCurrentRow(current_row + 1)
-            self.playlist.blockSignals(False)
-
-            if not self.audio_player.is_stopped():
-                self.play_selected_track()
-
-            self.update_skip_buttons()
+        self.advance_track(1, not self.audio_player.is_stopped())
 
     def skip_to_previous(self) -> None:
         """Skip to the previous track in the playlist."""
-        current_row = self.playlist.currentRow()
-        if current_row > 0:
-            self.playlist.blockSignals(True)
-            self.ignore_auto_advance = True
-            self.playlist.setCurrentRow(current_row - 1)
-            self.playlist.blockSignals(False)
+        self.advance_track(-1, not self.audio_player.is_stopped())
 
-            if not self.audio_player.is_stopped():
-                self.play_selected_track()
+    def advance_track(self, delta: int, play: bool) -> bool:
+        """
+        Move the playlist selection and optionally play the new track.
 
+        Args:
+            delta: Number of rows to move, negative to move back
+            play: Whether to play the newly selected track
+
+        Returns:
+            True if the selection moved, False at either end of the list
+        """
+        row = self.playlist.currentRow() + delta
+        if not 0 <= row < self.playlist.count():
+            return False
+
+        # The skip buttons are refreshed once below, not per signal
+        with QSignalBlocker(self.playlist):
+            self.playlist.setCurrentRow(row)
+
+        if play:
+            # Also refreshes the skip buttons and guards auto-advance
+            self.play_selected_track()
+        else:
             self.update_skip_buttons()
+        return True
 
     def open_file_dialog(self) -> None:
         """Open a file dialog to select a folder or audio file."""
@@ -617,8 +753,7 @@ class MainWindow(QWidget):
 
         if path:
             # Set folder and scan for tracks
-            self.track_manager.set_folder(path)
-            self.populate_playlist()
+            self.open_folder(path)
         else:
             # If folder selection was canceled, try file selection
             file_filter = (
@@ -631,51 +766,105 @@ class MainWindow(QWidget):
             if file:
                 # Set the folder to the parent directory of the selected file
                 folder = str(Path(file).parent)
-                self.track_manager.set_folder(folder)
-
                 # Add only the selected file to the playlist
-                self.playlist.clear()
-                self.playlist.addItem(os.path.basename(file))
-                self.playlist.setCurrentRow(0)
+                self.track_manager.set_folder(folder, [os.path.basename(file)])
 
                 self.save_settings()
 
-    def populate_playlist(self) -> None:
-        """Populate the playlist with tracks from the current folder."""
-        # Clear playlist
+    def open_folder(self, folder: str) -> None:
+        """
+        Start scanning a folder and show progress until the scan ends.
+
+        Args:
+            folder: Path to the music folder
+        """
+        self.close_scan_progress()
+        if not self.track_manager.set_folder(folder):
+            return
+
         self.playlist.clear()
 
         # Show progress dialog
-        progress = QProgressDialog(
-            "Scanning folder...", "Cancel", 0, 100, self
+        self.scan_progress = QProgressDialog(
+            "Scanning folder...", "Cancel", 0, 0, self
         )
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
+        # The scan runs on the thread pool, so the window stays usable
+        self.scan_progress.setWindowModality(Qt.WindowModality.NonModal)
+        self.scan_progress.canceled.connect(self.cancel_scan)
+        self.scan_progress.show()
 
-        # Define progress callback
-        def update_progress(current, total):
-            progress_value = int(min((current / max(total, 1)) * 100, 100))
-            progress.setValue(progress_value)
-            if progress.wasCanceled():
-                return False
-            return True
+    def update_scan_progress(self, current: int, total: int) -> None:
+        """
+        Update the scan progress dialog.
 
-        # Scan folder with progress updates
-        tracks = self.track_manager.scan_folder(update_progress)
+        Args:
+            current: Number of tracks found so far
+            total: Total number of tracks, or 0 while still scanning
+        """
+        if not self.scan_progress:
+            return
 
-        # Add tracks to playlist
-        for track in tracks:
-            self.playlist.addItem(track)
+        if total == 0:
+            # Total not known yet, show a busy indicator
+            self.scan_progress.setRange(0, 0)
+            self.scan_progress.setLabelText(
+                f"Scanning folder... {current} found"
+            )
+        else:
+            self.scan_progress.setRange(0, total)
+            self.scan_progress.setValue(current)
 
-        # Select first track
-        if self.playlist.count() > 0:
-            self.playlist.setCurrentRow(0)
+    def cancel_scan(self) -> None:
+        """Stop the running folder scan."""
+        self.track_manager.cancel_scan()
+        self.pending_track = None
+        self.close_scan_progress()
 
-        # Update UI
+        # Drop the partial list streamed in so far
+        self.playlist.clear()
         self.update_skip_buttons()
 
-        # Close progress dialog
-        progress.close()
+    def close_scan_progress(self) -> None:
+        """Close the scan progress dialog if it is open."""
+        progress, self.scan_progress = self.scan_progress, None
+        if progress:
+            # Closing emits canceled, which must not cancel the next scan
+            progress.canceled.disconnect(self.cancel_scan)
+            progress.close()
+            progress.deleteLater()
+
+    def append_tracks(self, tracks: list) -> None:
+        """
+        Show tracks found by a running scan before it completes.
+
+        Args:
+            tracks: Relative paths of the newly found tracks
+        """
+        if self.scan_progress:
+            self.playlist.addItems(tracks)
+
+    def populate_playlist(self, tracks: list) -> None:
+        """
+        Populate the playlist with tracks from the current folder.
+
+        Args:
+            tracks: Relative paths of the tracks found in the folder
+        """
+        self.close_scan_progress()
+
+        # A scan that streamed its tracks has already added every row
+        if self.playlist.track_model.tracks != tracks:
+            self.playlist.set_tracks(tracks)
+
+        # Select the last played track, or the first one unless the user
+        # already picked a streamed track during the scan
+        pending_track, self.pending_track = self.pending_track, None
+        if not (pending_track and self.playlist.select_track(pending_track)):
+            if self.playlist.currentRow() < 0 and self.playlist.count() > 0:
+                self.playlist.setCurrentRow(0)
+
+        # Update UI
+        self.update_skip_buttons()
 
     def update_speed(self) -> None:
         """Update the playback speed based on slider value."""
@@ -708,11 +897,11 @@ class MainWindow(QWidget):
         """
         if checked:
             self.audio_player.set_volume(0)
-            self.btn_mute.setIcon(QIcon(get_icon_path("unmute.svg")))
+            self.btn_mute.setIcon(self.icons["unmute.svg"])
             self.btn_mute.setToolTip("Unmute Audio")
         else:
             self.audio_player.set_volume(self.volume_slider.value() / 100.0)
-            self.btn_mute.setIcon(QIcon(get_icon_path("mute.svg")))
+            self.btn_mute.setIcon(self.icons["mute.svg"])
             self.btn_mute.setToolTip("Mute Audio")
 
         self.save_settings()
@@ -725,9 +914,8 @@ class MainWindow(QWidget):
             checked: Whether repeat is checked
         """
         if checked and self.btn_play_all.isChecked():
-            self.btn_play_all.blockSignals(True)
-            self.btn_play_all.setChecked(False)
-            self.btn_play_all.blockSignals(False)
+            with QSignalBlocker(self.btn_play_all):
+                self.btn_play_all.setChecked(False)
 
     def on_play_all_toggled(self, checked: bool) -> None:
         """
@@ -737,28 +925,21 @@ class MainWindow(QWidget):
             checked: Whether play all is checked
         """
         if checked and self.btn_repeat.isChecked():
-            self.btn_repeat.blockSignals(True)
-            self.btn_repeat.setChecked(False)
-            self.btn_repeat.blockSignals(False)
+            with QSignalBlocker(self.btn_repeat):
+                self.btn_repeat.setChecked(False)
 
-    def progress_bar_clicked(self, event) -> None:
+    def progress_bar_clicked(self, percentage: float) -> None:
         """
         Handle clicks on the progress bar to seek.
 
         Args:
-            event: Mouse event
+            percentage: Click position as a fraction of the bar's width
         """
         if not self.audio_player.current_track_url:
             return
 
-        # Calculate position from click
-        width = self.progress_bar.width()
-        x_pos = event.pos().x()
-        percentage = max(0, min(1, x_pos / width))
-
         # Calculate position in milliseconds
-        duration = self.audio_player.get_duration()
-        position = int(percentage * duration)
+        position = int(percentage * self.duration)
 
         # Seek to position
         self.audio_player.seek(position)
@@ -770,16 +951,28 @@ class MainWindow(QWidget):
         Args:
             position: Current position in milliseconds
         """
-        duration = self.audio_player.get_duration()
+        duration = self.duration
         if duration > 0:
             # Update progress bar
             progress = int((position / duration) * 100)
             self.progress_bar.setValue(progress)
 
-            # Update time label
-            self.time_label.setText(
-                format_position_duration(position, duration)
-            )
+            # Update time label only when the displayed second changes
+            shown_time = (position // 1000, duration)
+            if shown_time != self.shown_time:
+                self.shown_time = shown_time
+                self.time_label.setText(
+                    format_position_duration(position, duration)
+                )
+
+    def update_duration(self, duration: int) -> None:
+        """
+        Remember the current track's duration for position updates.
+
+        Args:
+            duration: Duration in milliseconds
+        """
+        self.duration = duration
 
     def handle_track_selection_changed(self) -> None:
         """Handle changes in the selected track."""
@@ -802,23 +995,18 @@ class MainWindow(QWidget):
             if (
                 self.btn_repeat.isChecked()
                 and self.audio_player.current_track_url
-                and self.audio_player.get_position()
-                == self.audio_player.get_duration()
+                and self.audio_player.get_position() == self.duration
             ):
                 self.audio_player.seek(0)
                 self.audio_player.play()
                 return
 
             # Auto play all if enabled
-            if self.btn_play_all.isChecked():
-                current_row = self.playlist.currentRow()
-                if current_row < self.playlist.count() - 1:
-                    self.playlist.setCurrentRow(current_row + 1)
-                    self.play_selected_track()
-                    return
+            if self.btn_play_all.isChecked() and self.advance_track(1, True):
+                return
 
             # End of playback or user stopped
-            self.btn_play_pause.setIcon(QIcon(get_icon_path("play.png")))
+            self.btn_play_pause.setIcon(self.icons["play.png"])
             self.btn_reset.setDisabled(True)
             self.update_skip_buttons()
 
@@ -840,20 +1028,24 @@ class MainWindow(QWidget):
                 return
 
             # Play All mode
-            if self.btn_play_all.isChecked():
-                current_row = self.playlist.currentRow()
-                if current_row < self.playlist.count() - 1:
-                    self.playlist.blockSignals(True)
-                    self.playlist.setCurrentRow(current_row + 1)
-                    self.playlist.blockSignals(False)
-                    self.play_selected_track()
-                    return
+            if self.btn_play_all.isChecked() and self.advance_track(1, True):
+                return
 
             # Reset UI
-            self.btn_play_pause.setIcon(QIcon(get_icon_path("play.png")))
+            self.btn_play_pause.setIcon(self.icons["play.png"])
             self.btn_reset.setDisabled(True)
             self.update_skip_buttons()
 
+        elif status == self.audio_player.media_player.MediaStatus.InvalidMedia:
+            # The backend could not open or decode the loaded file
+            self.btn_play_pause.setIcon(self.icons["play.png"])
+            self.btn_reset.setDisabled(True)
+            QMessageBox.warning(
+                self,
+                "Cannot Play File",
+                f"Cannot play {self.audio_player.current_track_path}",
+            )
+
     def update_track_metadata(self, metadata: dict) -> None:
         """
         Update UI with track metadata.
@@ -864,23 +1056,48 @@ class MainWindow(QWidget):
         # Update metadata display
         self.metadata_label.setText(format_metadata_display(metadata))
 
-        # Update album art
-        file_path = self.audio_player.current_track_path
-        if file_path:
-            album_art = extract_album_art(file_path)
-            if album_art:
-                self.album_art.setPixmap(
-                    album_art.scaled(
-                        80, 80, Qt.AspectRatioMode.KeepAspectRatio
-                    )
-                )
-            else:
-                # Reset to default album art
-                self.album_art.setPixmap(
-                    QPixmap(get_icon_path("default_album.png")).scaled(
-                        80, 80, Qt.AspectRatioMode.KeepAspectRatio
-                    )
-                )
+        # Decode the art the audio player loaded on the thread pool, so
+        # a large embedded cover cannot stall the track change
+        album_art = self.audio_player.current_album_art
+        self.album_art_request += 1
+        if not album_art:
+            # Reset to default album art
+            self.album_art.setPixmap(self.default_album_art)
+            return
+
+        # Reuse art already scaled for this version of the file
+        track_path = self.audio_player.current_track_path
+        try:
+            mtime = os.stat(track_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        self.album_art_key = f"album:{track_path}:{mtime}"
+        pixmap = QPixmapCache.find(self.album_art_key)
+        if pixmap is not None:
+            self.album_art.setPixmap(pixmap)
+            return
+
+        worker = AlbumArtWorker(self.album_art_request, album_art)
+        worker.signals.loaded.connect(self.show_album_art)
+        QThreadPool.globalInstance().start(worker)
+
+    def show_album_art(self, request_id: int, image: QImage) -> None:
+        """
+        Show album art decoded by an AlbumArtWorker.
+
+        Args:
+            request_id: Identifier of the request the art belongs to
+            image: Scaled album art, or a null image if it was unreadable
+        """
+        if request_id != self.album_art_request:
+            return
+
+        if image.isNull():
+            self.album_art.setPixmap(self.default_album_art)
+        else:
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self.album_art_key, pixmap)
+            self.album_art.setPixmap(pixmap)
 
     def set_track_title(self, title: str) -> None:
         """
@@ -890,48 +1107,42 @@ class MainWindow(QWidget):
             title: Track title
         """
         self.track_title = title
-        self.track_scroll_index = 0
 
-        metrics = QFontMetrics(self.track_label.font())
+        metrics = self.track_label.fontMetrics()
         text_width = metrics.horizontalAdvance(title)
         label_width = self.track_label.width()
 
-        if text_width > label_width:
-            self.scroll_timer.start()
+        self.scroll_needed = text_width > label_width
+        if self.scroll_needed:
+            # Rendered once here; scroll ticks only repaint the pixmap
+            self.track_label.setText("Now Playing: ")
+            self.track_label.set_scroll_text(title + "   -   ")
+            if not self.window_hidden:
+                self.scroll_timer.start()
         else:
             self.scroll_timer.stop()
+            self.track_label.set_scroll_text(None)
             self.track_label.setText(f"Now Playing: {title}")
 
     def scroll_track_title(self) -> None:
         """Scroll the track title if it exceeds the label width."""
-        spacer = "   -   "
-        full_text = self.track_title + spacer
-        metrics = QFontMetrics(self.track_label.font())
-
-        # Extract visible part based on pixel width
-        visible_width = self.track_label.width()
-        start = self.track_scroll_index
-
-        for i in range(1, len(full_text)):
-            if (
-                metrics.horizontalAdvance(full_text[start : start + i])
-                > visible_width
-            ):
-                break
-
-        visible_text = full_text[start : start + i]
-        self.track_label.setText(f"Now Playing: {visible_text}")
-        self.track_scroll_index = (self.track_scroll_index + 1) % len(
-            full_text
-        )
+        self.track_label.advance_scroll()
 
     def update_skip_buttons(self) -> None:
+        """Schedule a refresh of the skip buttons."""
+        self.skip_buttons_timer.start()
+
+    def refresh_skip_buttons(self) -> None:
         """Enable or disable skip buttons based on playlist selection."""
         current_row = self.playlist.currentRow()
         count = self.playlist.count()
+        state = (current_row > 0, current_row < count - 1 and count > 0)
+        if state == self.skip_state:
+            return
 
-        self.btn_prev.setEnabled(current_row > 0)
-        self.btn_next.setEnabled(current_row < count - 1 and count > 0)
+        self.skip_state = state
+        self.btn_prev.setEnabled(state[0])
+        self.btn_next.setEnabled(state[1])
 
     def closeEvent(self, event) -> None:
         """
@@ -940,9 +1151,34 @@ class MainWindow(QWidget):
         Args:
             event: Close event
         """
-        self.save_settings()
+        self.write_settings()
+        self.track_manager.cancel_scan()
+        self.audio_player.metadata_cache.close()
         event.accept()
 
+    def showEvent(self, event) -> None:
+        """
+        Resume scrolling the track title when the window is shown.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        self.window_hidden = False
+        if self.scroll_needed:
+            self.scroll_timer.start()
+
+    def hideEvent(self, event) -> None:
+        """
+        Stop scrolling the track title while the window is hidden.
+
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.window_hidden = True
+        self.scroll_timer.stop()
+
     def keyPressEvent(self, event) -> None:
         """
         Handle keyboard shortcuts.
@@ -950,49 +1186,38 @@ class MainWindow(QWidget):
         Args:
             event: Key press event
         """
+        # Plain keys fire whatever the modifiers, Ctrl shortcuts only
+        # with Ctrl alone held
         key = event.key()
-        modifiers = event.modifiers()
-
-        if key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
-            current_row = self.playlist.currentRow()
-            if key == Qt.Key.Key_Up:
-                self.playlist.setCurrentRow(max(0, current_row - 1))
-            else:
-                self.playlist.setCurrentRow(
-                    min(self.playlist.count() - 1, current_row + 1)
-                )
-        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-            self.play_selected_track()
-        elif key == Qt.Key.Key_Space:
-            self.toggle_play_pause()
-        elif key == Qt.Key.Key_Escape:
-            self.reset_playback()
-        elif (
-            key == Qt.Key.Key_O
-            and modifiers == Qt.KeyboardModifier.ControlModifier
-        ):
-            self.open_file_dialog()
-        elif (
-            key == Qt.Key.Key_M
-            and modifiers == Qt.KeyboardModifier.ControlModifier
-        ):
-            self.btn_mute.toggle()
-        elif (
-            key == Qt.Key.Key_R
-            and modifiers == Qt.KeyboardModifier.ControlModifier
-        ):
-            self.btn_repeat.toggle()
-        elif (
-            key == Qt.Key.Key_Plus
-            and modifiers == Qt.KeyboardModifier.ControlModifier
-        ):
-            self.speed_slider.setValue(
-                min(150, self.speed_slider.value() + 10)
-            )
-        elif (
-            key == Qt.Key.Key_Minus
-            and modifiers == Qt.KeyboardModifier.ControlModifier
+        action = self.key_actions.get(key)
+        if (
+            action is None
+            and event.modifiers() == Qt.KeyboardModifier.ControlModifier
         ):
-            self.speed_slider.setValue(max(50, self.speed_slider.value() - 10))
+            action = self.ctrl_key_actions.get(key)
+
+        if action is not None:
+            action()
         else:
             super().keyPressEvent(event)
+
+    def select_previous_row(self) -> None:
+        """Move the playlist selection up one row."""
+        row = self.playlist.currentRow()
+        if row != 0:
+            self.playlist.setCurrentRow(max(0, row - 1))
+
+    def select_next_row(self) -> None:
+        """Move the playlist selection down one row."""
+        row = self.playlist.currentRow()
+        last = self.playlist.count() - 1
+        if row != last:
+            self.playlist.setCurrentRow(min(last, row + 1))
+
+    def speed_up(self) -> None:
+        """Raise the playback speed by 10%, up to 150%."""
+        self.speed_slider.setValue(min(150, self.speed_slider.value() + 10))
+
+    def speed_down(self) -> None:
+        """Lower the playback speed by 10%, down to 50%."""
+        self.speed_slider.setValue(max(50, self.speed_slider.value() - 10))
@@ -4,13 +4,168 @@ Playlist widget for MiniPlayer.
 This module contains the playlist view component.
 """
 
-from PyQt6.QtWidgets import QListWidget
+from typing import Dict, List, Optional
 
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
+from PyQt6.QtWidgets import QListView
 
-class PlaylistWidget(QListWidget):
-    """Custom list widget for audio track playlist."""
+
+class TrackListModel(QAbstractListModel):
+    """List model holding the relative paths of the playlist tracks."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty track list model."""
+        super().__init__(parent)
+        self.tracks: List[str] = []
+        self.rows: Dict[str, int] = {}  # Track path -> source row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of tracks."""
+        return 0 if parent.isValid() else len(self.tracks)
+
+    def data(
+        self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Optional[str]:
+        """Return the track path shown for a row."""
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.tracks[index.row()]
+        return None
+
+    def set_tracks(self, tracks: List[str]) -> None:
+        """
+        Replace all tracks with a single model reset.
+
+        Args:
+            tracks: Relative track paths
+        """
+        self.beginResetModel()
+        self.tracks = list(tracks)
+        self.rows = {track: row for row, track in enumerate(self.tracks)}
+        self.endResetModel()
+
+    def append_tracks(self, tracks: List[str]) -> None:
+        """
+        Append tracks to the end of the list.
+
+        Args:
+            tracks: Relative track paths
+        """
+        if not tracks:
+            return
+
+        first = len(self.tracks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tracks) - 1)
+        self.tracks.extend(tracks)
+        self.rows.update(
+            (track, row) for row, track in enumerate(tracks, first)
+        )
+        self.endInsertRows()
+
+
+class PlaylistWidget(QListView):
+    """Custom list view for audio track playlist."""
+
+    # Emitted when the selected track changes
+    itemSelectionChanged = pyqtSignal()
 
     def __init__(self, parent=None):
         """Initialize the playlist widget."""
         super().__init__(parent)
         self.setAlternatingRowColors(True)
+        self.setUniformItemSizes(True)
+        # Lay out large libraries across event loop passes instead of
+        # blocking the window while every row is positioned
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+
+        # Filtering runs in the proxy's C++ code, so a keystroke never
+        # calls back into Python per track
+        self.track_model = TrackListModel(self)
+        self.track_proxy = QSortFilterProxyModel(self)
+        self.track_proxy.setSourceModel(self.track_model)
+        self.track_proxy.setFilterCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+        )
+        self.setModel(self.track_proxy)
+        self.selectionModel().selectionChanged.connect(
+            lambda *_: self.itemSelectionChanged.emit()
+        )
+
+    def count(self) -> int:
+        """Return the number of tracks shown by the current filter."""
+        return self.track_proxy.rowCount()
+
+    def currentRow(self) -> int:
+        """Return the shown row of the current track, or -1."""
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int) -> None:
+        """
+        Make a shown row the current track.
+
+        Args:
+            row: Row among the tracks shown by the current filter
+        """
+        self.setCurrentIndex(self.track_proxy.index(row, 0))
+
+    def current_track(self) -> Optional[str]:
+        """Return the relative path of the current track, if any."""
+        index = self.currentIndex()
+        return index.data() if index.isValid() else None
+
+    def select_track(self, track: str) -> bool:
+        """
+        Make a track current if it is shown.
+
+        Args:
+            track: Relative path of the track
+
+        Returns:
+            True if the track was found and selected, False otherwise
+        """
+        row = self.track_model.rows.get(track)
+        if row is None:
+            return False
+
+        index = self.track_proxy.mapFromSource(self.track_model.index(row, 0))
+        if not index.isValid():
+            return False
+
+        self.setCurrentIndex(index)
+        return True
+
+    def clear(self) -> None:
+        """Remove all tracks."""
+        self.track_model.set_tracks([])
+
+    def addItems(self, tracks: List[str]) -> None:
+        """
+        Append tracks to the playlist.
+
+        Args:
+            tracks: Relative track paths
+        """
+        self.track_model.append_tracks(tracks)
+
+    def set_tracks(self, tracks: List[str]) -> None:
+        """
+        Replace the playlist contents.
+
+        Args:
+            tracks: Relative track paths
+        """
+        self.track_model.set_tracks(tracks)
+
+    def set_filter(self, text: str) -> None:
+        """
+        Show only tracks whose path contains the text, ignoring case.
+
+        Args:
+            text: Search text; empty shows every track
+        """
+        self.track_proxy.setFilterFixedString(text)
@@ -0,0 +1,109 @@
+"""
+Scrolling label widget for MiniPlayer.
+
+This module contains the label that scrolls the now playing title.
+"""
+
+from typing import Optional
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtWidgets import QLabel
+
+
+class ScrollingLabel(QLabel):
+    """Label that scrolls a line of text after its own text."""
+
+    def __init__(self, text: str = "", parent=None):
+        """
+        Initialize the scrolling label.
+
+        Args:
+            text: Fixed text shown before the scrolling text
+            parent: Parent widget
+        """
+        super().__init__(text, parent)
+        self.scroll_pixmap: Optional[QPixmap] = None  # Pre-rendered text
+        self.scroll_width = 0  # Width of the rendered text in pixels
+        self.scroll_offset = 0  # Pixels scrolled past the text start
+        self.scroll_indent = 0  # Width of the fixed text in pixels
+        self.scroll_step = 1  # Pixels moved per advance_scroll call
+
+    def set_scroll_text(self, text: Optional[str]) -> None:
+        """
+        Render the text to scroll, so scrolling never lays it out again.
+
+        The text scrolls right of the label's text as set at the time of
+        the call.
+
+        Args:
+            text: Text to scroll, looping around; None stops scrolling
+        """
+        self.scroll_offset = 0
+        if not text:
+            self.scroll_pixmap = None
+            self.update()
+            return
+
+        self.ensurePolished()
+        metrics = self.fontMetrics()
+        self.scroll_indent = metrics.horizontalAdvance(self.text())
+        self.scroll_width = metrics.horizontalAdvance(text)
+        self.scroll_step = max(1, metrics.averageCharWidth())
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            round(self.scroll_width * ratio), round(metrics.height() * ratio)
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(0, metrics.ascent(), text)
+        painter.end()
+
+        self.scroll_pixmap = pixmap
+        self.update()
+
+    def advance_scroll(self) -> None:
+        """Move the scrolling text one step to the left."""
+        if self.scroll_pixmap is None:
+            return
+
+        self.scroll_offset = (
+            self.scroll_offset + self.scroll_step
+        ) % self.scroll_width
+        self.update(self.scroll_rect())
+
+    def scroll_rect(self) -> QRect:
+        """Return the area right of the fixed text that the text scrolls in."""
+        rect = self.contentsRect()
+        rect.setLeft(rect.left() + self.scroll_indent)
+        return rect
+
+    def paintEvent(self, event) -> None:
+        """
+        Paint the fixed text, then the visible part of the scrolling text.
+
+        Args:
+            event: Paint event
+        """
+        super().paintEvent(event)
+        if self.scroll_pixmap is None:
+            return
+
+        rect = self.scroll_rect()
+        height = round(
+            self.scroll_pixmap.height() / self.scroll_pixmap.devicePixelRatio()
+        )
+        y = rect.top() + (rect.height() - height) // 2
+
+        # The text loops, so a second copy fills in behind the first
+        painter = QPainter(self)
+        painter.setClipRect(rect)
+        x = rect.left() - self.scroll_offset
+        while x < rect.right():
+            painter.drawPixmap(x, y, self.scroll_pixmap)
+            x += self.scroll_width
+        painter.end()
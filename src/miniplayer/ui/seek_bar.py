@@ -0,0 +1,25 @@
+"""
+Seek bar widget for MiniPlayer.
+
+This module contains the clickable playback progress bar.
+"""
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QProgressBar
+
+
+class SeekBar(QProgressBar):
+    """Progress bar that reports where along its width it was clicked."""
+
+    # Click position as a fraction of the bar's width
+    clicked = pyqtSignal(float)
+
+    def mousePressEvent(self, event) -> None:
+        """
+        Emit the clicked position as a fraction of the width.
+
+        Args:
+            event: Mouse event
+        """
+        x_pos = event.position().x()
+        self.clicked.emit(max(0.0, min(1.0, x_pos / self.width())))
@@ -10,6 +10,10 @@ from .helpers import (
     format_metadata_display,
     format_position_duration,
     get_icon_path,
+    read_album_art_data,
+    read_audio_metadata,
+    read_track_info,
+    scale_album_art,
 )
 
 __all__ = [
@@ -18,4 +22,8 @@ __all__ = [
     "format_metadata_display",
     "get_icon_path",
     "extract_album_art",
+    "read_album_art_data",
+    "read_audio_metadata",
+    "read_track_info",
+    "scale_album_art",
 ]
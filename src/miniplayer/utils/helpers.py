@@ -5,12 +5,68 @@ This module contains helper functions used throughout the application.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from PyQt6.QtCore import QTime
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 
+# Icons and default artwork bundled inside the miniplayer package
+_ASSETS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "_assets"
+)
+_XDG_DATA_DIRS = (
+    os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+).split(":")
+# Directories searched by get_icon_path, in order. The bundled assets
+# always ship with the package, so they come first and usually hit on
+# the first stat.
+_ICON_SEARCH_DIRS = (
+    os.path.join(_ASSETS_DIR, "icons"),
+    _ASSETS_DIR,
+    # System install locations
+    *(
+        os.path.join(data_dir, "icons", "hicolor", size, "apps")
+        for data_dir in _XDG_DATA_DIRS
+        for size in ("scalable", "48x48")
+    ),
+    # Flatpak/Snap locations
+    *_XDG_DATA_DIRS,
+)
+# Lines shown by format_metadata_display, in display order, as
+# (metadata key, HTML template, optional value conversion)
+_METADATA_FIELDS = (
+    # Basic info
+    ("title", "<b>Title:</b> {}", None),
+    ("artist", "<b>Artist:</b> {}", None),
+    ("album", "<b>Album:</b> {}", None),
+    # Track info, dropping the total from "1/10" style numbers
+    ("tracknumber", "<b>Track:</b> {}", lambda value: value.split("/")[0]),
+    # Technical info
+    ("duration", "<b>Duration:</b> {}", lambda value: format_duration(value)),
+    ("bitrate", "<b>Bitrate:</b> {} kbps", None),
+    ("sample_rate", "<b>Sample Rate:</b> {} Hz", None),
+    # Additional metadata
+    ("date", "<b>Year:</b> {}", None),
+    ("genre", "<b>Genre:</b> {}", None),
+    ("composer", "<b>Composer:</b> {}", None),
+)
+# Tag names read by the mutagen metadata fallback
+_COMMON_TAGS = frozenset(
+    (
+        "title",
+        "artist",
+        "album",
+        "date",
+        "tracknumber",
+        "genre",
+        "composer",
+        "copyright",
+        "isrc",
+    )
+)
+
 
 def format_duration(seconds: float) -> str:
     """
@@ -37,10 +93,10 @@ def format_position_duration(position_ms: int, duration_ms: int) -> str:
     Returns:
         Formatted time string (MM:SS / MM:SS)
     """
-    current_time = QTime(0, 0).addMSecs(position_ms)
-    total_time = QTime(0, 0).addMSecs(duration_ms)
-
-    return f"{current_time.toString('mm:ss')} / {total_time.toString('mm:ss')}"
+    # Plain integer formatting; no QTime objects per update
+    current = format_duration(position_ms // 1000)
+    total = format_duration(duration_ms // 1000)
+    return f"{current} / {total}"
 
 
 def format_metadata_display(metadata: Dict[str, Any]) -> str:
@@ -56,74 +112,245 @@ def format_metadata_display(metadata: Dict[str, Any]) -> str:
     if not metadata:
         return "No metadata available"
 
-    display = []
+    # Only the shown fields decide the HTML, so revisited tracks hit the
+    # cache even if other metadata differs
+    return _format_metadata_fields(
+        tuple(
+            (index, metadata[field[0]])
+            for index, field in enumerate(_METADATA_FIELDS)
+            if field[0] in metadata
+        )
+    )
 
-    # Basic info
-    if "title" in metadata:
-        display.append(f"<b>Title:</b> {metadata['title']}")
-    if "artist" in metadata:
-        display.append(f"<b>Artist:</b> {metadata['artist']}")
-    if "album" in metadata:
-        display.append(f"<b>Album:</b> {metadata['album']}")
-
-    # Track info
-    if "tracknumber" in metadata:
-        track_num = metadata["tracknumber"].split("/")[
-            0
-        ]  # Handle "1/10" format
-        display.append(f"<b>Track:</b> {track_num}")
 
-    # Technical info
-    if "duration" in metadata:
-        display.append(
-            f"<b>Duration:</b> {format_duration(metadata['duration'])}"
-        )
-    if "bitrate" in metadata:
-        display.append(f"<b>Bitrate:</b> {metadata['bitrate']} kbps")
-    if "sample_rate" in metadata:
-        display.append(f"<b>Sample Rate:</b> {metadata['sample_rate']} Hz")
+@lru_cache(maxsize=256)
+def _format_metadata_fields(values: Tuple[Tuple[int, Any], ...]) -> str:
+    """
+    Build the metadata HTML for the fields a track has.
 
-    # Additional metadata
-    if "date" in metadata:
-        display.append(f"<b>Year:</b> {metadata['date']}")
-    if "genre" in metadata:
-        display.append(f"<b>Genre:</b> {metadata['genre']}")
-    if "composer" in metadata:
-        display.append(f"<b>Composer:</b> {metadata['composer']}")
+    Args:
+        values: (index into _METADATA_FIELDS, value) for each shown field
 
-    return "<br>".join(display)
+    Returns:
+        HTML-formatted string for display
+    """
+    lines = []
+    for index, value in values:
+        _, template, convert = _METADATA_FIELDS[index]
+        lines.append(template.format(convert(value) if convert else value))
+    return "<br>".join(lines)
 
 
+@lru_cache(maxsize=64)
 def get_icon_path(icon_name: str) -> Optional[str]:
     """
     Find the path to an icon file.
 
+    Results are cached, so each icon name only probes the filesystem once.
+
     Args:
         icon_name: Name of the icon file
 
     Returns:
         Absolute path to the icon, or None if not found
     """
-    paths = [
-        # System install locations
-        f"/usr/share/icons/hicolor/scalable/apps/{icon_name}",
-        f"/usr/share/icons/hicolor/48x48/apps/{icon_name}",
-        # Local development
-        os.path.join(
-            os.path.dirname(__file__), "..", "..", "icons", f"{icon_name}"
-        ),
-        os.path.join(os.path.dirname(__file__), "..", "..", f"{icon_name}"),
-        # Flatpak/Snap locations
-        f"/usr/share/{icon_name}",
-    ]
-
-    for path in paths:
-        if os.path.exists(path):
+    for icon_dir in _ICON_SEARCH_DIRS:
+        path = os.path.join(icon_dir, icon_name)
+        if os.path.isfile(path):
             return path
 
     return None
 
 
+def read_audio_metadata(file_path: Path) -> Dict[str, Any]:
+    """
+    Extract metadata using tinytag, falling back to mutagen.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Dictionary containing audio metadata
+    """
+    try:
+        from tinytag import TinyTag
+
+        tag = TinyTag.get(str(file_path))
+    except Exception:
+        # tinytag rejects some files that mutagen can still read
+        return _read_mutagen_metadata(file_path)
+    return _tinytag_metadata(tag)
+
+
+def read_track_info(
+    file_path: Path,
+) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    """
+    Read metadata and album art in a single pass over the tags.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Tuple of (metadata, album art bytes or None)
+    """
+    try:
+        from tinytag import TinyTag
+
+        tag = TinyTag.get(str(file_path), image=True)
+    except Exception:
+        return _read_mutagen_metadata(file_path), read_album_art_data(
+            file_path
+        )
+
+    picture = tag.images.any
+    album_art = picture.data if picture is not None else None
+    return _tinytag_metadata(tag), album_art
+
+
+def _tinytag_metadata(tag: Any) -> Dict[str, Any]:
+    """
+    Map a TinyTag onto the same keys the mutagen reader produces.
+
+    Args:
+        tag: Parsed tinytag result
+
+    Returns:
+        Dictionary containing audio metadata
+    """
+    metadata = {}
+    fields = {
+        "title": tag.title,
+        "artist": tag.artist,
+        "album": tag.album,
+        "date": tag.year,
+        "tracknumber": tag.track,
+        "genre": tag.genre,
+        "composer": tag.composer,
+    }
+    for key, value in fields.items():
+        if value is not None:
+            metadata[key] = str(value)
+    for key in ("copyright", "isrc"):
+        values = tag.other.get(key)
+        if values:
+            metadata[key] = str(values[0])
+
+    # Get technical info
+    if tag.duration is not None:
+        metadata["duration"] = tag.duration
+    if tag.bitrate is not None:
+        metadata["bitrate"] = int(tag.bitrate)
+    if tag.samplerate is not None:
+        metadata["sample_rate"] = tag.samplerate
+    if tag.channels is not None:
+        metadata["channels"] = tag.channels
+
+    return metadata
+
+
+def _read_mutagen_metadata(file_path: Path) -> Dict[str, Any]:
+    """
+    Extract metadata using mutagen.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Dictionary containing audio metadata
+    """
+    try:
+        from mutagen import File
+
+        audio = File(file_path)
+        if audio is None:
+            return {}
+
+        metadata = {}
+
+        # Get standard tags, visiting only the tags the file has
+        tags = getattr(audio, "tags", None)
+        if tags:
+            for key in tags.keys():
+                tag = key.lower()
+                if tag in _COMMON_TAGS and tag not in metadata:
+                    metadata[tag] = str(tags[key][0])
+
+        # Get duration
+        metadata["duration"] = audio.info.length
+
+        # Get technical info
+        if hasattr(audio.info, "bitrate"):
+            metadata["bitrate"] = audio.info.bitrate // 1000
+        if hasattr(audio.info, "sample_rate"):
+            metadata["sample_rate"] = audio.info.sample_rate
+        if hasattr(audio.info, "channels"):
+            metadata["channels"] = audio.info.channels
+
+        # Handle specific file types
+        if Path(file_path).suffix.lower() == ".flac":
+            if "tracknumber" not in metadata and "track" in audio.tags:
+                metadata["tracknumber"] = str(audio.tags["track"][0])
+
+        return metadata
+
+    except Exception as e:
+        print(f"Error reading metadata: {e}")
+        return {}
+
+
+def read_album_art_data(file_path: Path) -> Optional[bytes]:
+    """
+    Read the raw embedded album art image from an audio file.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Encoded image bytes, or None if the file has no album art
+    """
+    try:
+        from tinytag import TinyTag
+
+        # Skip the duration scan, only the embedded picture is needed
+        tag = TinyTag.get(str(file_path), duration=False, image=True)
+    except Exception:
+        return _read_album_art_data_mutagen(file_path)
+
+    picture = tag.images.any
+    return picture.data if picture is not None else None
+
+
+def scale_album_art(image: Any, size: int = 80) -> Any:
+    """
+    Scale album art down to the display size.
+
+    Large covers are first shrunk cheaply to a few times the target size,
+    so the smooth filter only runs over a small image.
+
+    Args:
+        image: QImage or QPixmap to scale
+        size: Width and height of the square to fit the art into
+
+    Returns:
+        Scaled image of the same type as the input
+    """
+    prescale = size * 4
+    if image.width() > prescale or image.height() > prescale:
+        image = image.scaled(
+            prescale,
+            prescale,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+    return image.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
 def extract_album_art(file_path: Path) -> Optional[QPixmap]:
     """
     Extract album art from an audio file.
@@ -134,7 +361,30 @@ def extract_album_art(file_path: Path) -> Optional[QPixmap]:
     Returns:
         QPixmap with album art, or None if extraction fails
     """
+    data = read_album_art_data(file_path)
+    if not data:
+        return None
+    pixmap = QPixmap()
+    pixmap.loadFromData(data)
+    return None if pixmap.isNull() else pixmap
+
+
+def _read_album_art_data_mutagen(file_path: Path) -> Optional[bytes]:
+    """
+    Read album art with mutagen for files tinytag cannot parse.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Encoded image bytes, or None if extraction fails
+    """
     try:
+        # MP3 art lives in the ID3 tag, so read just the tag instead of
+        # letting File() also probe the MPEG stream for its info
+        if Path(file_path).suffix.lower() == ".mp3":
+            return _read_id3_album_art(file_path)
+
         from mutagen import File
 
         audio = File(file_path)
@@ -145,25 +395,31 @@ def extract_album_art(file_path: Path) -> Optional[QPixmap]:
 
         # Check for embedded art
         if hasattr(audio, "pictures") and audio.pictures:
-            picture = audio.pictures[0]
-            pixmap = QPixmap()
-            pixmap.loadFromData(picture.data)
-            if not pixmap.isNull():
-                return pixmap
-
-        # For MP3 files with ID3 tags
-        if (
-            file_path.suffix.lower() == ".mp3"
-            and hasattr(audio, "tags")
-            and "APIC:" in audio.tags
-        ):
-            picture = audio.tags["APIC:"].data
-            pixmap = QPixmap()
-            pixmap.loadFromData(picture)
-            if not pixmap.isNull():
-                return pixmap
+            return audio.pictures[0].data
 
     except Exception as e:
         print(f"Error extracting album art: {e}")
 
     return None
+
+
+def _read_id3_album_art(file_path: Path) -> Optional[bytes]:
+    """
+    Read album art from an ID3 tag without parsing the audio stream.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Encoded image bytes, or None if the tag has no picture
+    """
+    from mutagen.id3 import ID3, ID3NoHeaderError
+
+    try:
+        tags = ID3(file_path)
+    except ID3NoHeaderError:
+        return None
+
+    # Any APIC frame, not only the one with an empty description
+    pictures = tags.getall("APIC")
+    return pictures[0].data if pictures else None